@@ -0,0 +1,34 @@
+"""Main benchmark module for performance tracking.
+
+Usage:
+------
+    python3 benchmark.py [--sizes 50 100 ...] [--repeat 5] [--warmup 1]
+                         [--output benchmark_results.json]
+
+Author:
+-------
+ - Paulo Sánchez (@erlete)
+"""
+
+
+from argparse import ArgumentParser
+
+from tests.benchmark import CONFIG
+from tests.benchmark import main as benchmark_main
+
+
+# Argument parsing:
+
+
+parser = ArgumentParser(description="Maze operations benchmark suite.")
+parser.add_argument("--sizes", type=int, nargs='+', default=CONFIG["sizes"])
+parser.add_argument("--repeat", type=int, default=CONFIG["repeat"])
+parser.add_argument("--warmup", type=int, default=CONFIG["warmup"])
+parser.add_argument("--output", type=str, default=CONFIG["output"])
+CONFIG.update(vars(parser.parse_args()))
+
+
+# Benchmarks execution:
+
+
+benchmark_main()
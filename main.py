@@ -30,8 +30,12 @@ MENU.add_item(
     MenuItem("Generate maze", MENU.generate_maze),
     MenuItem("Depth-first search", MENU.df_search),
     MenuItem("Breadth-first search", MENU.bf_search),
+    MenuItem("Bidirectional search", MENU.bd_search),
     MenuItem("Greedy best-first search", MENU.gbf_search),
     MenuItem("Radial search", MENU.r_search),
+    MenuItem("A* search", MENU.as_search),
+    MenuItem("Dijkstra search", MENU.dk_search),
+    MenuItem("Jump point search", MENU.jp_search),
     MenuItem("Display ASCII", MENU.display_ascii),
     MenuItem("Display image", MENU.display_image),
     MenuItem("Save image", MENU.save_image),
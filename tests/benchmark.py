@@ -0,0 +1,175 @@
+"""Benchmark module.
+
+This module measures the scaling of the main maze operations (generation,
+searches, ASCII and image rendering) over a sweep of maze sizes, reporting
+timing percentiles and peak memory usage, and exports the results to a JSON
+file so that they can be compared between releases.
+
+Author:
+-------
+ - Paulo Sanchez (@erlete)
+"""
+
+
+import json
+import platform
+import tracemalloc
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+from utils.internal.batch import ALGORITHMS
+from utils.internal.maze import Maze
+
+
+# Configuration constants:
+
+
+CONFIG = {
+    "sizes": (50, 100, 200, 500, 1000, 2000),
+    "repeat": 5,
+    "warmup": 1,
+    "seed": 0,
+    "image_limit": 1000,  # Largest size rendered as an image.
+    "cell_size": 5,
+    "percentiles": (5, 25, 50, 75, 95),
+    "output": "benchmark_results.json",
+    "verbose": True
+}
+
+
+# Auxiliary methods:
+
+
+def log(message: str):
+    """Prints a message if the verbose option is enabled."""
+
+    if CONFIG["verbose"]:
+        print(message)
+
+
+def measure(function, setup=lambda: None) -> dict:
+    """Runs a function several times and returns its statistics.
+
+    The function is called with the value returned by the setup function,
+    which is not timed. Warmup runs are discarded, and peak memory usage is
+    traced on a separate run, since tracing slows down the execution.
+
+    Parameters:
+    -----------
+     - function : callable
+        Function to be measured.
+     - setup : callable
+        Function that returns the argument of each measured call.
+    """
+
+    for _ in range(CONFIG["warmup"]):
+        function(setup())
+
+    timings = []
+
+    for _ in range(CONFIG["repeat"]):
+        argument = setup()
+        cron_start = perf_counter()
+        function(argument)
+        timings.append(perf_counter() - cron_start)
+
+    argument = setup()
+    tracemalloc.start()
+    function(argument)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    percentiles = np.percentile(timings, CONFIG["percentiles"])
+
+    return {
+        "runs": len(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "mean": sum(timings) / len(timings),
+        "median": float(np.median(timings)),
+        **{f"p{percentile}": float(value)
+           for percentile, value in zip(CONFIG["percentiles"], percentiles)},
+        "peak_memory": peak_memory
+    }
+
+
+def record(results: list, operation: str, size: int, stats: dict) -> None:
+    """Appends a measurement to the results and logs it."""
+
+    results.append({"operation": operation, "size": size, **stats})
+    log(f"   - {operation:<26} median {stats['median']:.4}s, "
+        + f"p95 {stats['p95']:.4}s, peak {stats['peak_memory'] / 2**20:.4}MiB")
+
+
+# Benchmark methods:
+
+
+def generation_benchmark(results: list, size: int) -> None:
+    """Measures the maze generation time."""
+
+    record(results, "generation", size, measure(
+        lambda _: Maze(size, CONFIG["seed"])
+    ))
+
+
+def search_benchmark(results: list, size: int, maze: Maze) -> None:
+    """Measures the time of every search method on the same maze.
+
+    The metrics of an additional untraced run (see `SearchStats`) are also
+    recorded, so that the time of each search stage can be compared.
+    """
+
+    for search in ALGORITHMS:
+        stats = measure(lambda maze: getattr(maze, search)(), lambda: maze)
+        getattr(maze, search)()
+        record(results, search, size, {
+            **stats, "search_stats": maze.stats.as_dict()
+        })
+
+
+def rendering_benchmark(results: list, size: int, maze: Maze) -> None:
+    """Measures the ASCII and image rendering times."""
+
+    record(results, "ascii", size, measure(
+        lambda maze: maze.ascii(), lambda: maze
+    ))
+
+    if size <= CONFIG["image_limit"]:
+        record(results, "image", size, measure(
+            lambda maze: maze.image(False, cell_size=CONFIG["cell_size"]),
+            lambda: maze
+        ))
+
+
+# Main execution:
+
+
+def main():
+    """Main executable function."""
+
+    log(" · Benchmarks started...")
+    results = []
+
+    for size in CONFIG["sizes"]:
+        log(f" · {size}x{size} maze:")
+        generation_benchmark(results, size)
+
+        maze = Maze(size, CONFIG["seed"])
+        search_benchmark(results, size, maze)
+        rendering_benchmark(results, size, maze)
+        log('')
+
+    with open(CONFIG["output"], 'w', encoding="utf-8") as file:
+        json.dump({
+            "metadata": {
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "platform": platform.platform(),
+                **{key: CONFIG[key] for key in ("repeat", "warmup", "seed")}
+            },
+            "results": results
+        }, file, indent=4)
+
+    log(f" > Benchmarks finished, results saved to {CONFIG['output']}.")
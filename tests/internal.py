@@ -9,9 +9,18 @@ Author:
 """
 
 
+from io import StringIO
+from os import path, remove
+from tempfile import gettempdir
 from time import perf_counter
 
 import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+from utils.internal.batch import (ALGORITHMS, compare_algorithms,
+                                   generate_mazes)
+from utils.internal.frontier import (BucketQueueFrontier,
+                                     PriorityQueueFrontier, QueueFrontier)
 from utils.internal.maze import Maze
 
 
@@ -47,6 +56,137 @@ def generation_test():
     log(f" > Maze generated in {perf_counter() - cron_start:.4}s.\n")
 
 
+def generation_equivalence_test():
+    """Ensures that vectorized generation matches the node-by-node one."""
+
+    log(" · Generation equivalence test started...")
+
+    for seed in range(CONFIG["cycles"] // 5):
+        maze = Maze(CONFIG.get("dimensions"), seed, vectorized=False)
+        states = maze._grid.states.copy()
+
+        maze = Maze.__new__(Maze)
+        super(Maze, maze).__init__(CONFIG.get("dimensions"), seed)
+        maze._generate_path(vectorized=True, deduplicate=False)
+        assert (maze._grid.states == states).all(), f"seed {seed} differs"
+
+    log(" > Generation equivalence finished.\n")
+
+
+def seed_test():
+    """Ensures that mazes are reproducible from their seed."""
+
+    log(" · Seed test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.breadth_first_search()
+    clone = Maze(CONFIG.get("dimensions"), maze.seed)
+    clone.breadth_first_search()
+
+    assert (maze._grid.states == clone._grid.states).all()
+    assert [node.index for node in maze.optimal_path] \
+        == [node.index for node in clone.optimal_path]
+
+    # Seeds must fit in the serialization header:
+    for seed, error in (("abc", TypeError), (1.5, TypeError),
+                        (2 ** 70, ValueError)):
+        try:
+            Maze(CONFIG.get("dimensions"), seed)
+            assert False, f"seed {seed!r} must be rejected"
+        except error:
+            pass
+
+    for seed in (-2 ** 63, 2 ** 63 - 1):
+        assert Maze.from_bytes(
+            Maze(CONFIG.get("dimensions"), seed).to_bytes()
+        ).seed == seed
+
+    log(" > Seed test finished.\n")
+
+
+def end_placement_test():
+    """Ensures that the end node is placed on the farthest path node."""
+
+    log(" · End placement test started...")
+    cron_start = perf_counter()
+
+    for seed in range(CONFIG["cycles"] // 5):
+        maze = Maze(CONFIG.get("dimensions"), seed)
+        path_nodes = np.flatnonzero(maze._grid.states > 0)
+        ys, xs = np.divmod(path_nodes, maze.width)
+        assert maze.manhattan_distance(maze._start, maze._end) == max(
+            np.abs(xs - maze._start.x) + np.abs(ys - maze._start.y)
+        )
+
+        # The farthest end has the longest optimal path of every node:
+        maze = Maze(CONFIG.get("dimensions"), seed, farthest_end=True)
+        assert maze.breadth_first_search()
+        assert len(maze.optimal_path) - 1 \
+            == maze._get_distances(maze._start.index).max()
+
+    log(f" > End placement finished in {perf_counter() - cron_start:.4}s.\n")
+
+
+def batch_generation_test():
+    """Ensures that parallel generation matches sequential generation."""
+
+    log(" · Batch generation test started...")
+    cron_start = perf_counter()
+    seeds = set(range(8))
+
+    for maze in generate_mazes(8, CONFIG["dimensions"], list(seeds), 2):
+        expected = Maze(CONFIG["dimensions"], maze.seed)
+        seeds.remove(maze.seed)
+        assert (maze._grid.states == expected._grid.states).all()
+        assert (maze._grid.colors == expected._grid.colors).all()
+        assert maze._start == maze._grid.node_at(expected._start.index)
+
+    assert not seeds
+    log(f" > Batch generated in {perf_counter() - cron_start:.4}s.\n")
+
+
+def save_load_test():
+    """Ensures that mazes are restored exactly from their files."""
+
+    log(" · Save and load test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.depth_first_search()
+    file_path = path.join(gettempdir(), f"maze_{maze.seed}.maze")
+
+    for packed, mmap in ((False, True), (False, False), (True, True)):
+        maze.save(file_path, packed)
+        clone = Maze.load(file_path, mmap)
+
+        # Loading does not allocate search data:
+        assert clone._grid._parents is None and clone._grid._weights is None
+
+        clone._reset_explored_nodes()
+
+        assert clone.seed == maze.seed and clone.dimensions == maze.dimensions
+        assert (clone._grid.states == maze._get_path_states()).all()
+        assert clone._start.index == maze._start.index
+        assert clone.count["path"] == maze.count["path"]
+
+        # Searches must not modify the file:
+        clone.breadth_first_search()
+        assert (Maze.load(file_path)._grid.states
+                == clone._get_path_states()).all()
+
+    remove(file_path)
+    log(" > Save and load finished.\n")
+
+
+def grid_memory_test():
+    """Ensures that the grid stores each cell in a few bytes."""
+
+    log(" · Grid memory test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    per_cell = maze._grid.nbytes / maze._grid.size
+    assert per_cell <= 16, f"{per_cell} bytes per cell"
+    assert maze._start.state == -10 and maze._end.state == 10
+    assert not hasattr(maze._start, "__dict__")  # Nodes only use slots.
+    log(f" > Grid uses {per_cell:.4} bytes per cell.\n")
+
+
 def ascii_test():
     """Ensures that the ASCII representation works correctly."""
 
@@ -56,6 +196,21 @@ def ascii_test():
     log(" > ASCII representation finished.\n")
 
 
+def ascii_stream_test():
+    """Ensures that the streamed ASCII representation matches the full one."""
+
+    log(" · ASCII stream test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.depth_first_search()
+    stream = StringIO()
+    maze.write_ascii(stream)
+
+    rows = list(maze.iter_ascii())
+    assert len(rows) == maze.height + 2
+    assert stream.getvalue() == maze.ascii() + '\n'
+    log(" > ASCII stream finished.\n")
+
+
 def image_show_test():
     """Ensures that the image is correctly shown."""
 
@@ -74,6 +229,160 @@ def image_save_test():
     log(" > Image saving finished.\n")
 
 
+def priority_queue_frontier_test():
+    """Ensures that the priority queue frontier sorts nodes correctly."""
+
+    log(" · Priority queue frontier test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    nodes = [maze._grid.node_at(index) for index in range(4)]
+    priorities = dict(zip(nodes, (3, 1, 2, 1)))
+
+    frontier = PriorityQueueFrontier(key=priorities.get)
+    frontier.add(nodes)
+    frontier.add(nodes[0], priority=0)  # Decrease-key.
+    frontier.add(nodes[2], priority=5)  # Ignored, higher than current.
+
+    order = [frontier.remove() for _ in range(len(frontier))]
+    assert order == [nodes[0], nodes[3], nodes[1], nodes[2]]
+    assert frontier.is_empty()
+    log(" > Priority queue frontier finished.\n")
+
+
+def bucket_queue_frontier_test():
+    """Ensures that the bucket queue frontier sorts nodes correctly."""
+
+    log(" · Bucket queue frontier test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    nodes = [maze._grid.node_at(index) for index in range(4)]
+
+    frontier = BucketQueueFrontier(span=3)
+    for node, priority in zip(nodes, (3, 1, 2, 1)):
+        frontier.add(node, priority)
+    frontier.add(nodes[0], priority=0)  # Decrease-key.
+    frontier.add(nodes[2], priority=3)  # Ignored, higher than current.
+
+    order = [frontier.remove() for _ in range(len(frontier))]
+    assert order == [nodes[0], nodes[3], nodes[1], nodes[2]]
+    assert frontier.is_empty()
+
+    try:
+        frontier.add(nodes[0], priority=7)  # Beyond the span.
+        assert False, "priorities beyond the span must be rejected"
+    except ValueError:
+        pass
+
+    log(" > Bucket queue frontier finished.\n")
+
+
+def queue_frontier_test():
+    """Ensures that the queue frontier scales linearly with its size."""
+
+    log(" · Queue frontier test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    timings = {}
+
+    for size in (20_000, 200_000):
+        nodes = [maze._start] * size
+        frontier = QueueFrontier()
+        cron_start = perf_counter()
+        frontier.add(nodes)
+
+        while not frontier.is_empty():
+            frontier.remove()
+
+        timings[size] = perf_counter() - cron_start
+        log(f"   - {size} nodes queued in {timings[size]:.4}s.")
+
+    # A tenfold size increase must not cause a quadratic time increase:
+    assert timings[200_000] / timings[20_000] < 50
+    log(" > Queue frontier finished.\n")
+
+
+def adjacency_index_test():
+    """Ensures that the adjacency index matches the maze's path."""
+
+    log(" · Adjacency index test started...")
+    maze = Maze(CONFIG.get("dimensions"), shuffle_neighbors=False)
+
+    for index in range(maze._grid.size):
+        node = maze._grid.node_at(index)
+        expected = {
+            neighbor for neighbor in maze._get_neighbors(node)
+            if node.state != 0 and neighbor.state != 0
+        }
+        assert set(maze._get_path_neighbors(node)) == expected
+
+    # Deterministic runs must explore the maze in the same order:
+    maze.depth_first_search()
+    first_run = maze._explored[:]
+    maze.depth_first_search()
+    assert maze._explored == first_run
+    log(" > Adjacency index finished.\n")
+
+
+def search_reset_test():
+    """Ensures that consecutive searches leave no explored nodes behind."""
+
+    log(" · Search reset test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    states, colors = maze._grid.states.copy(), maze._grid.colors.copy()
+
+    for search in (maze.depth_first_search, maze.breadth_first_search,
+                   maze.greedy_best_first_search, maze.a_star_search):
+        search()
+        maze._reset_explored_nodes()
+        assert (maze._grid.states == states).all()
+        assert (maze._grid.colors == colors).all()
+        assert not maze.optimal_path
+
+    log(" > Search reset finished.\n")
+
+
+def image_render_test():
+    """Ensures that the image is rendered with any cell size."""
+
+    log(" · Image render test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.breadth_first_search()
+
+    for cell_size in (1, 5, 50):
+        pixels = maze.render(cell_size)
+        assert pixels.shape == (
+            maze.height * cell_size, maze.width * cell_size, 3
+        )
+
+    # Single-pixel cells are just the node colors:
+    assert (maze.render(1).reshape(-1, 3) == maze._grid.colors).all()
+    log(" > Image render finished.\n")
+
+
+def animation_test():
+    """Ensures that animation frames are drawn and exported correctly."""
+
+    log(" · Animation test started...")
+    cron_start = perf_counter()
+    maze = Maze(CONFIG.get("dimensions"), 1)
+    maze.breadth_first_search()
+    frames = [canvas.copy() for canvas, _ in maze.iter_frames(5, 4)]
+
+    # The last frame must match the final image of the search:
+    assert (frames[-1] == maze.render(5)).all()
+
+    file_path = maze.animation(
+        path.join(gettempdir(), f"maze_{maze.seed}.gif"), 5, 4
+    )
+
+    with Image.open(file_path) as animation:
+        assert animation.n_frames == len(frames)
+
+        for number, frame in enumerate(frames):
+            animation.seek(number)
+            assert (np.asarray(animation.convert("RGB")) == frame).all()
+
+    remove(file_path)
+    log(f" > Animation finished in {perf_counter() - cron_start:.4}s.\n")
+
+
 def depth_first_search_test():
     """Ensures that the depth-first search algorithm works correctly."""
 
@@ -94,6 +403,30 @@ def breadth_first_search_test():
     log(f" > BFS finished in {perf_counter() - cron_start:.4}s.\n")
 
 
+def bidirectional_search_test():
+    """Ensures that the bidirectional search algorithm finds optimal paths."""
+
+    log(" · Bidirectional search test started...")
+    cron_start = perf_counter()
+    explored = {"bfs": 0, "bidirectional": 0}
+
+    for seed in range(CONFIG["cycles"] // 5):
+        maze = Maze(CONFIG.get("dimensions"), seed)
+        maze.breadth_first_search()
+        path, explored["bfs"] = maze.optimal_path, \
+            explored["bfs"] + maze.count["explored"]
+
+        assert maze.bidirectional_search()
+        assert len(maze.optimal_path) == len(path)
+        assert maze.optimal_path[0] == maze._start
+        assert maze.optimal_path[-1] == maze._end
+        explored["bidirectional"] += maze.count["explored"]
+
+    assert explored["bidirectional"] < explored["bfs"]
+    log(f" > Bidirectional search finished in "
+        + f"{perf_counter() - cron_start:.4}s.\n")
+
+
 def greedy_best_first_search_test():
     """Ensures that the greedy best-first search algorithm works correctly."""
 
@@ -104,6 +437,279 @@ def greedy_best_first_search_test():
     log(f" > GBFS finished in {perf_counter() - cron_start:.4}s.\n")
 
 
+def a_star_search_test():
+    """Ensures that the A* search algorithm finds optimal paths."""
+
+    log(" · A* test started...")
+    cron_start = perf_counter()
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.breadth_first_search()
+    bfs_path, bfs_count = len(maze.optimal_path), maze.count["explored"]
+
+    for heuristic in (maze.manhattan_distance, maze.radial_distance):
+        assert maze.a_star_search(heuristic)
+        assert len(maze.optimal_path) == bfs_path
+        assert maze.count["explored"] <= bfs_count
+
+    # Admissible but inconsistent heuristics still give optimal paths:
+    for seed in range(CONFIG["cycles"] * 6):
+        generator = np.random.default_rng(seed)
+        states = (generator.random(64) > .3).astype(np.int8)
+        states[0], states[-1] = -10, 10
+        maze = Maze._from_states((8, 8), seed, states, 0, 63)
+        distances, factors = maze.distance_field(), generator.random(64)
+
+        if distances[0] > 0:
+            assert maze.a_star_search(
+                lambda node, end: distances[node.index] * factors[node.index]
+            )
+            assert len(maze.optimal_path) == distances[0] + 1
+
+    log(f" > A* finished in {perf_counter() - cron_start:.4}s.\n")
+
+
+def optimal_path_test():
+    """Ensures that optimal paths are rebuilt from the parent array."""
+
+    log(" · Optimal path test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+
+    for algorithm in ALGORITHMS:
+        assert getattr(maze, algorithm)()
+        path = maze.optimal_path
+        assert path[0] == maze._start and path[-1] == maze._end
+        assert all(node.state == 3 for node in path[1:-1])
+        assert all(maze.manhattan_distance(node, following) == 1
+                   for node, following in zip(path, path[1:]))
+        assert maze._explored.typecode == 'i'
+
+    log(" > Optimal path finished.\n")
+
+
+def distance_field_test():
+    """Ensures that cached distance fields give shortest paths."""
+
+    log(" · Distance field test started...")
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.breadth_first_search()
+    field = maze.distance_field()
+    assert maze.distance_field(maze._end) is field  # Cached field.
+
+    # Paths read off the field are as long as breadth-first search ones:
+    path = maze.shortest_path(maze._start)
+    assert len(path) == len(maze.optimal_path)
+    assert path[0] == maze._start.index and path[-1] == maze._end.index
+    assert all(field[path] == range(len(path) - 1, -1, -1))
+    assert len(maze.shortest_path(maze._end)) == 1
+    wall = int(np.argmin(maze._grid.states != 0))
+    assert not len(maze.shortest_path(wall))
+    assert not field.flags.writeable
+
+    # Walls cannot be targets:
+    for query in (
+        lambda: maze.distance_field(wall),
+        lambda: maze.shortest_path(maze._start, wall)
+    ):
+        try:
+            query()
+            assert False, "wall targets must be rejected"
+        except ValueError:
+            pass
+
+    # The least recently used field is evicted:
+    targets = np.flatnonzero(maze._grid.states != 0)
+    for target in targets[:maze.DISTANCE_CACHE_SIZE + 1].tolist():
+        maze.distance_field(target)
+    assert len(maze._distance_cache) == maze.DISTANCE_CACHE_SIZE
+
+    # Generating the path again discards every field:
+    maze._generate_path()
+    assert not maze._distance_cache
+    assert maze.distance_field() is not field
+
+    log(" > Distance field finished.\n")
+
+
+def solve_many_test():
+    """Ensures that batch queries find paths without modifying the maze."""
+
+    log(" · Batch query test started...")
+    cron_start = perf_counter()
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.depth_first_search()
+    states, path = maze._grid.states.copy(), list(maze.optimal_path)
+
+    cells = np.flatnonzero(maze._grid.states != 0)[::7].tolist()
+    pairs = [
+        (divmod(start, maze.width)[::-1], divmod(end, maze.width)[::-1])
+        for start, end in zip(cells, reversed(cells))
+    ]
+    shortest = maze.solve_many(pairs)
+
+    for algorithm in ("a_star_search", "depth_first_search"):
+        for (start, end), paths in zip(pairs, zip(
+                shortest, maze.solve_many(pairs, algorithm))):
+            for query_path in paths:
+                assert query_path[0] == maze._grid.index(*start)
+                assert query_path[-1] == maze._grid.index(*end)
+
+            if algorithm == "a_star_search":
+                assert len(paths[0]) == len(paths[1])
+
+    assert (maze._grid.states == states).all() and maze.optimal_path == path
+
+    try:
+        wall = int(np.argmin(maze._grid.states != 0))
+        maze.solve_many([(divmod(wall, maze.width)[::-1], pairs[0][1])])
+        assert False, "wall queries must be rejected"
+    except ValueError:
+        pass
+
+    log(f" > Batch query finished in {perf_counter() - cron_start:.4}s.\n")
+
+
+def search_iterator_test():
+    """Ensures that step-wise searches match their blocking variants."""
+
+    log(" · Search iterator test started...")
+    maze = Maze(CONFIG.get("dimensions"), 1, shuffle_neighbors=False)
+
+    for algorithm in ALGORITHMS:
+        found = getattr(maze, algorithm)()
+        path, explored = list(maze.optimal_path), maze.count["explored"]
+
+        steps = list(getattr(maze, f"iter_{algorithm}")())
+        assert all(frontier >= 0 for _, frontier in steps)
+        assert maze.optimal_path == path and bool(path) == found
+        assert maze.count["explored"] == explored
+
+        # Stopped searches are neither colored nor solved:
+        for step, _ in enumerate(getattr(maze, f"iter_{algorithm}")()):
+            if step == 4:
+                break
+
+        assert not maze.optimal_path and maze.count["explored"] == 5
+
+    log(" > Search iterator finished.\n")
+
+
+def search_stats_test():
+    """Ensures that every search fills its statistics consistently."""
+
+    log(" · Search statistics test started...")
+    maze = Maze(CONFIG.get("dimensions"), 1)
+    expansions = []
+    maze.expansion_callback = lambda node, stats: expansions.append(node)
+
+    for algorithm in ALGORITHMS:
+        expansions.clear()
+        getattr(maze, algorithm)()
+        stats = maze.stats
+
+        assert stats.expanded == len(expansions) > 0
+        assert stats.enqueued >= stats.expanded
+        assert 0 <= stats.duplicate_enqueues < stats.enqueued
+        assert stats.peak_frontier > 0
+        assert stats.neighbor_time + stats.frontier_time \
+            + stats.finish_time <= stats.total_time
+        log(f"   - {algorithm}: {stats.expanded} expanded, "
+            + f"{stats.enqueued} enqueued in {stats.total_time:.4}s.")
+
+    # Stage timing can be disabled without changing the counters:
+    maze.stage_timing = False
+    maze.breadth_first_search()
+    assert maze.stats.neighbor_time == maze.stats.frontier_time == 0
+    assert maze.stats.enqueued >= maze.stats.expanded > 0
+    assert maze.stats.duplicate_enqueues == 0  # Nodes are queued once.
+    assert maze.stats.total_time > 0
+
+    log(" > Search statistics finished.\n")
+
+
+def dijkstra_search_test():
+    """Ensures that Dijkstra search finds the lowest cost paths."""
+
+    log(" · Dijkstra test started...")
+    cron_start = perf_counter()
+    maze = Maze(CONFIG.get("dimensions"))
+    maze.breadth_first_search()
+    length = len(maze.optimal_path)
+
+    # Without terrain costs, the path is as short as possible:
+    assert maze.dijkstra_search() and len(maze.optimal_path) == length
+
+    maze.set_terrain(maximum=5)
+    costs = []
+
+    for search in (maze.dijkstra_search, lambda: maze.dijkstra_search(True),
+                   maze.a_star_search):
+        assert search()
+        costs.append(sum(1 + node.weight for node in maze.optimal_path[1:]))
+
+    assert costs[0] == costs[1] == costs[2]
+    assert len(maze.optimal_path) >= length
+
+    # Costs are laid out as rows of the maze, or flat:
+    terrain = np.arange(maze.width * maze.height).reshape(
+        maze.height, maze.width)
+    maze.set_terrain(terrain)
+    assert maze._grid.node(1, 0).weight == terrain[0, 1]
+    maze.set_terrain(terrain.ravel())
+    assert maze._grid.node(0, 1).weight == terrain[1, 0]
+
+    try:
+        maze.set_terrain(terrain.reshape(maze.height // 2, -1))
+        assert False, "costs with other shapes must be rejected"
+    except ValueError:
+        pass
+
+    log(f" > Dijkstra finished in {perf_counter() - cron_start:.4}s.\n")
+
+
+def jump_point_search_test():
+    """Ensures that jump point search finds optimal paths with few nodes."""
+
+    log(" · JPS test started...")
+    cron_start = perf_counter()
+    explored = {"a_star": 0, "jps": 0}
+
+    for seed in range(CONFIG["cycles"] // 5):
+        maze = Maze(CONFIG.get("dimensions"), seed)
+        maze.a_star_search()
+        path, explored["a_star"] = len(maze.optimal_path), \
+            explored["a_star"] + maze.stats.expanded
+
+        assert maze.jump_point_search()
+        assert len(maze.optimal_path) == path
+        assert all(maze.manhattan_distance(node, following) == 1
+                   for node, following in zip(maze.optimal_path,
+                                              maze.optimal_path[1:]))
+        explored["jps"] += maze.stats.expanded
+
+    assert explored["jps"] < explored["a_star"]
+    log(f" > JPS finished in {perf_counter() - cron_start:.4}s.\n")
+
+
+def compare_algorithms_test():
+    """Ensures that concurrent searches match sequential ones."""
+
+    log(" · Algorithm comparison test started...")
+    maze = Maze(CONFIG.get("dimensions"), shuffle_neighbors=False)
+    maze.depth_first_search()
+    states = maze._grid.states.copy()
+    results = compare_algorithms(maze, workers=2)
+    assert (maze._grid.states == states).all()  # The maze is not modified.
+
+    for algorithm, result in results.items():
+        getattr(maze, algorithm)()
+        assert result["path_length"] == len(maze.optimal_path)
+        assert result["explored"] == maze.count["explored"]
+        log(f"   - {algorithm}: {result['explored']} explored nodes, "
+            + f"path of {result['path_length']} in {result['time']:.4}s.")
+
+    log(" > Algorithm comparison finished.\n")
+
+
 # Main execution:
 
 
@@ -112,10 +718,34 @@ def main():
 
     log(" ·Tests started...")
     generation_test()
+    generation_equivalence_test()
+    seed_test()
+    end_placement_test()
+    batch_generation_test()
+    save_load_test()
+    grid_memory_test()
     ascii_test()
+    ascii_stream_test()
     image_show_test()
     image_save_test()
+    image_render_test()
+    animation_test()
+    priority_queue_frontier_test()
+    bucket_queue_frontier_test()
+    queue_frontier_test()
+    adjacency_index_test()
+    search_reset_test()
     depth_first_search_test()
     breadth_first_search_test()
+    bidirectional_search_test()
     greedy_best_first_search_test()
+    a_star_search_test()
+    dijkstra_search_test()
+    jump_point_search_test()
+    optimal_path_test()
+    distance_field_test()
+    solve_many_test()
+    search_iterator_test()
+    search_stats_test()
+    compare_algorithms_test()
     log(" > Tests finished.")
@@ -66,6 +66,15 @@ class InterfaceMenu(Menu):
         print(
             f"  · Breadth-first search completed successfully ({perf_counter() - cron:.4}s)\n")
 
+    def bd_search(self):
+        """Interface for bidirectional search."""
+
+        print("  · Bidirectional search...")
+        cron = perf_counter()
+        self.maze.bidirectional_search()
+        print(
+            f"  · Bidirectional search completed successfully ({perf_counter() - cron:.4}s)\n")
+
     def gbf_search(self):
         """Interface for greedy-best-first search."""
 
@@ -84,11 +93,38 @@ class InterfaceMenu(Menu):
         print(
             f"  · Radial search completed successfully ({perf_counter() - cron:.4}s)\n")
 
+    def as_search(self):
+        """Interface for A* search."""
+
+        print("  · A* search...")
+        cron = perf_counter()
+        self.maze.a_star_search()
+        print(
+            f"  · A* search completed successfully ({perf_counter() - cron:.4}s)\n")
+
+    def dk_search(self):
+        """Interface for Dijkstra search."""
+
+        print("  · Dijkstra search...")
+        cron = perf_counter()
+        self.maze.dijkstra_search()
+        print(
+            f"  · Dijkstra search completed successfully ({perf_counter() - cron:.4}s)\n")
+
+    def jp_search(self):
+        """Interface for jump point search."""
+
+        print("  · Jump point search...")
+        cron = perf_counter()
+        self.maze.jump_point_search()
+        print(
+            f"  · Jump point search completed successfully ({perf_counter() - cron:.4}s)\n")
+
     def display_ascii(self):
         """Interface for ASCII maze display."""
 
         print("  · Displaying maze in ASCII format...")
-        print(self.maze.ascii())
+        self.maze.write_ascii()
         print("  · Maze displayed successfully\n")
 
     def display_image(self):
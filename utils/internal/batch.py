@@ -0,0 +1,210 @@
+"""Container module for batch maze operations.
+
+This module contains functions that distribute maze operations over a pool of
+worker processes, so that large amounts of mazes can be generated and searched
+using every available core.
+
+Author:
+-------
+ - Paulo Sanchez (@erlete)
+"""
+
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from random import randrange
+from time import perf_counter
+
+import numpy as np
+from utils.internal.maze import Maze
+
+
+ALGORITHMS = (
+    "depth_first_search",
+    "breadth_first_search",
+    "bidirectional_search",
+    "greedy_best_first_search",
+    "radial_search",
+    "a_star_search",
+    "dijkstra_search",
+    "jump_point_search"
+)
+
+
+def _generate_maze(dimensions, seed: int, vectorized: bool) -> bytes:
+    """Generates a maze in a worker process and returns it serialized.
+
+    Only the compact binary representation of the maze is sent back to the
+    parent process, instead of the whole pickled object.
+    """
+
+    return Maze(dimensions, seed, vectorized=vectorized).to_bytes()
+
+
+def generate_mazes(n: int, dimensions, seeds=None, workers=None,
+                   vectorized=True, shuffle_neighbors=True):
+    """Generates several mazes in parallel, yielding them as they finish.
+
+    Mazes are yielded in completion order, not in seed order (each maze's seed
+    is available through its `seed` attribute). Only a limited amount of
+    mazes is pending at once, so the parent process does not hold every maze
+    in memory if results are consumed as they arrive.
+
+    Parameters:
+    -----------
+     - n: int
+        The amount of mazes to generate.
+     - dimensions: int, tuple
+        The dimensions of every maze (see `Maze`).
+     - seeds: list (default=None)
+        The seed of each maze. If not given, random seeds are chosen.
+     - workers: int (default=None)
+        The amount of worker processes. Defaults to the amount of CPUs.
+     - vectorized: bool (default=True)
+        Determines whether the path is generated with NumPy array operations.
+     - shuffle_neighbors: bool (default=True)
+        Determines whether the neighbors of each node are visited in a random
+        order during searches.
+    """
+
+    if seeds is None:
+        seeds = [randrange(2 ** 32) for _ in range(n)]
+
+    elif len(seeds) != n:
+        raise ValueError("'seeds' must contain exactly 'n' values.")
+
+    workers = workers or cpu_count() or 1
+    seeds, pending = iter(seeds), set()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+
+            # Keeps every worker busy without queueing every maze at once:
+            for seed in seeds:
+                pending.add(executor.submit(
+                    _generate_maze, dimensions, seed, vectorized
+                ))
+
+                if len(pending) >= 2 * workers:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield Maze.from_bytes(future.result(), shuffle_neighbors)
+
+
+def _run_search(name: str, layout: tuple, header: tuple, algorithm: str,
+                shuffle_neighbors: bool) -> dict:
+    """Runs a search algorithm in a worker process over a shared maze.
+
+    The adjacency index and the terrain costs are read from the shared memory
+    block without copying them. Only the cell states, which searches modify,
+    are copied, and the rest of the search state (parent and color data) is
+    allocated by the worker when first needed.
+    """
+
+    width, height, start, end, seed = header
+    memory = SharedMemory(name=name)
+    states = offsets = neighbors = weights = maze = None
+
+    try:
+        states, offsets, neighbors, weights = (
+            np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=offset)
+            for shape, dtype, offset in layout
+        )
+
+        weights.flags.writeable = False  # Searches never modify weights.
+
+        maze = Maze._from_states(
+            (width, height), seed, states.copy(), start, end,
+            shuffle_neighbors, (offsets, neighbors), weights
+        )
+
+        cron_start = perf_counter()
+        found = getattr(maze, algorithm)()
+        elapsed = perf_counter() - cron_start
+
+        return {
+            "found": found,
+            "path_length": len(maze.optimal_path),
+            "explored": maze.count["explored"],
+            "time": elapsed,
+            "stats": maze.stats.as_dict()
+        }
+
+    finally:
+        # Views over the shared buffer must be released before closing it:
+        states = offsets = neighbors = weights = maze = None
+        memory.close()
+
+
+def compare_algorithms(maze: Maze, algorithms=ALGORITHMS,
+                       workers=None) -> dict:
+    """Runs several search algorithms on the same maze concurrently.
+
+    The maze's cell states, adjacency index and terrain costs are placed in a
+    shared memory block once, and each algorithm runs in its own process over
+    it, so the grid is not copied per worker. The maze itself is not modified.
+
+    Parameters:
+    -----------
+     - maze: Maze
+        The maze to be searched.
+     - algorithms: iterable (default=ALGORITHMS)
+        The names of the `Search` methods to run.
+     - workers: int (default=None)
+        The amount of worker processes. Defaults to one per algorithm, up to
+        the amount of CPUs.
+
+    Returns a dictionary that maps each algorithm to its results: whether the
+    end was found, the optimal path length, the amount of explored nodes, the
+    wall time of the search and its metrics (see `SearchStats`).
+    """
+
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown search algorithm '{algorithm}'.")
+
+    arrays = (
+        maze._get_path_states(), *maze._get_adjacency(), maze._grid.weights
+    )
+
+    # Each array is placed right after the previous one in the shared block:
+    layout, size = [], 0
+    for array in arrays:
+        layout.append((array.shape, array.dtype.str, size))
+        size += array.nbytes
+
+    memory = SharedMemory(create=True, size=max(size, 1))
+
+    try:
+        for array, (shape, dtype, offset) in zip(arrays, layout):
+            np.ndarray(
+                shape, dtype, buffer=memory.buf, offset=offset
+            )[:] = array
+
+        header = Maze.HEADER.unpack(maze._pack_header())
+
+        with ProcessPoolExecutor(
+            max_workers=workers or min(len(algorithms), cpu_count() or 1)
+        ) as executor:
+            futures = {
+                algorithm: executor.submit(
+                    _run_search, memory.name, tuple(layout), header,
+                    algorithm, maze.shuffle_neighbors
+                ) for algorithm in algorithms
+            }
+
+            return {
+                algorithm: future.result()
+                for algorithm, future in futures.items()
+            }
+
+    finally:
+        memory.close()
+        memory.unlink()
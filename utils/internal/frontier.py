@@ -1,7 +1,8 @@
 """Container module for the Frontier classes.
 
-This module contains three classes: one of them is a generic Frontier
-interface and the others are specific to a stack or queue data structure.
+This module contains five classes: one of them is a generic Frontier
+interface and the others are specific to a stack, queue, priority queue or
+bucket queue data structure.
 
 Author:
 -------
@@ -9,6 +10,9 @@ Author:
 """
 
 
+from collections import deque
+from heapq import heappop, heappush
+
 from utils.internal.node import Node
 
 
@@ -44,10 +48,13 @@ class Frontier:
     def is_empty(self) -> bool:
         """Determines whether the frontier is empty or not."""
 
-        return len(self._nodes) == 0
+        return len(self) == 0
+
+    def __len__(self):
+        return len(self._nodes)
 
     def __str__(self):
-        return f"<Frontier object with {len(self._nodes)} nodes>"
+        return f"<Frontier object with {len(self)} nodes>"
 
     def __repr__(self):
         return f"Frontier({self._nodes})"
@@ -63,9 +70,205 @@ class StackFrontier(Frontier):
 
 
 class QueueFrontier(Frontier):
-    """Frontier variant that allows node removal in a FIFO manner."""
+    """Frontier variant that allows node removal in a FIFO manner.
+
+    Nodes are stored in a double-ended queue, so that removal from the front
+    takes constant time instead of shifting every remaining node.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._nodes = deque()
 
     def remove(self) -> None:
         """Removes a node from the frontier."""
 
-        return self._nodes.pop(0)
+        return self._nodes.popleft()
+
+
+class PriorityQueueFrontier(Frontier):
+    """Frontier variant that allows node removal by lowest priority.
+
+    Nodes are stored in a binary heap, so both addition and removal take
+    logarithmic time. Ties are broken by insertion order, the most recently
+    added node being removed first. Adding a node that is already in the
+    frontier with a lower priority updates it (decrease-key), while the
+    outdated heap entry is lazily discarded on removal.
+
+    Parameters:
+    -----------
+     - key : callable
+        Function that returns the priority of a node. Defaults to the node's
+        weight.
+    """
+
+    @property
+    def nodes(self):
+        return [entry[2] for entry in sorted(self._entries.values())]
+
+    def __init__(self, key=None):
+        super().__init__()
+        self._key = key if key is not None else (lambda node: node.weight)
+        self._entries = {}
+        self._counter = 0
+
+    def add(self, value, priority=None) -> None:
+        """Adds a node to the frontier.
+
+        Supports single or collective addition of nodes. If a priority is
+        given, it is used for every added node instead of the key function.
+        """
+
+        if isinstance(value, Node):
+            self._push(value, priority)
+
+        elif isinstance(value, (list, tuple, set)):
+            for node in value:
+                self._push(node, priority)
+
+        else:
+            raise TypeError("Invalid type for node addition.")
+
+    def _push(self, node, priority) -> None:
+        """Pushes a node into the heap or decreases its priority."""
+
+        if priority is None:
+            priority = self._key(node)
+
+        if node in self._entries:
+            if self._entries[node][0] <= priority:
+                return
+
+            self._entries[node][2] = None  # Marks the entry as removed.
+
+        self._counter += 1
+        entry = [priority, -self._counter, node]
+        self._entries[node] = entry
+        heappush(self._nodes, entry)
+
+    def remove(self) -> Node:
+        """Removes the node with the lowest priority from the frontier."""
+
+        while self._nodes:
+            node = heappop(self._nodes)[2]
+
+            if node is not None:
+                del self._entries[node]
+                return node
+
+        raise IndexError("remove from an empty frontier.")
+
+    def priority(self, node) -> float:
+        """Returns the current priority of a node in the frontier."""
+
+        return self._entries[node][0]
+
+    def __contains__(self, node):
+        return node in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"PriorityQueueFrontier({self.nodes})"
+
+
+class BucketQueueFrontier(Frontier):
+    """Frontier variant that allows node removal by lowest integer priority.
+
+    Nodes are stored in a circular array of buckets, one per priority, so
+    both addition and removal take constant time instead of logarithmic
+    (Dial's algorithm). Priorities must be integers that never decrease
+    below the last removed one, and never exceed it by more than the span
+    (i.e. the distances of a shortest path search with integer step costs).
+    Ties are broken by insertion order, the most recently added node being
+    removed first. Adding a node that is already in the frontier with a
+    lower priority updates it, while the outdated entry is lazily discarded.
+
+    Parameters:
+    -----------
+     - span : int
+        The largest difference between the priorities of a removed node and
+        the nodes added after it (i.e. the largest step cost).
+    """
+
+    @property
+    def nodes(self):
+        return [entry[1] for entry in sorted(
+            self._entries.values(), key=lambda entry: entry[0]
+        )]
+
+    def __init__(self, span: int):
+        if not isinstance(span, int) or span < 0:
+            raise ValueError("'span' must be a non-negative integer.")
+
+        super().__init__()
+        self._nodes = [[] for _ in range(span + 1)]
+        self._entries = {}
+        self._current = 0  # Lowest priority that might be in the frontier.
+
+    def add(self, value, priority=0) -> None:
+        """Adds a node to the frontier.
+
+        Supports single or collective addition of nodes, which are added with
+        the same priority.
+        """
+
+        if isinstance(value, Node):
+            self._push(value, priority)
+
+        elif isinstance(value, (list, tuple, set)):
+            for node in value:
+                self._push(node, priority)
+
+        else:
+            raise TypeError("Invalid type for node addition.")
+
+    def _push(self, node, priority) -> None:
+        """Pushes a node into its bucket or decreases its priority."""
+
+        if not self._current <= priority < self._current + len(self._nodes):
+            raise ValueError(f"priority {priority} is out of the frontier's "
+                             + "span.")
+
+        if node in self._entries:
+            if self._entries[node][0] <= priority:
+                return
+
+            self._entries[node][1] = None  # Marks the entry as removed.
+
+        entry = [priority, node]
+        self._entries[node] = entry
+        self._nodes[int(priority) % len(self._nodes)].append(entry)
+
+    def remove(self) -> Node:
+        """Removes the node with the lowest priority from the frontier."""
+
+        if not self._entries:
+            raise IndexError("remove from an empty frontier.")
+
+        while True:
+            bucket = self._nodes[self._current % len(self._nodes)]
+
+            while bucket:
+                node = bucket.pop()[1]
+
+                if node is not None:
+                    del self._entries[node]
+                    return node
+
+            self._current += 1
+
+    def priority(self, node) -> int:
+        """Returns the current priority of a node in the frontier."""
+
+        return self._entries[node][0]
+
+    def __contains__(self, node):
+        return node in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"BucketQueueFrontier({self.nodes})"
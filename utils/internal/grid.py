@@ -0,0 +1,186 @@
+"""Container module for the Grid class.
+
+This module contains the class structure that stores every cell attribute of a
+maze (state, parent, weight and color) in typed NumPy arrays, so that Node
+objects can be created on demand as lightweight views over it.
+
+Author:
+-------
+ - Paulo Sanchez (@erlete)
+"""
+
+
+import numpy as np
+from utils.internal.node import Node, NodeBase
+
+
+class Grid:
+    """Typed array storage for the cells of a maze.
+
+    Every cell is identified by its flat index, computed as
+    `y * width + x`. Attributes are stored in one array per attribute
+    instead of one Python object per cell, which reduces the memory usage of
+    each cell from hundreds of bytes to a few.
+
+    Parameters:
+    -----------
+     - width : int
+        The amount of columns of the grid.
+     - height : int
+        The amount of rows of the grid.
+     - states : np.ndarray (default=None)
+        Flat int8 array with the initial state of every cell, which is used
+        without being copied (i.e. a memory-mapped file). If not given, every
+        cell is a wall.
+     - weights : np.ndarray (default=None)
+        Flat float32 array with the weight of every cell, which is used
+        without being copied (i.e. a shared memory block). If not given,
+        every weight is zero.
+    """
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def states(self):
+        return self._states
+
+    @property
+    def parents(self):
+        if self._parents is None:  # Parents are only allocated when needed.
+            self._parents = np.full(self._size, -1, dtype=np.int32)
+
+        return self._parents
+
+    @property
+    def weights(self):
+        if self._weights is None:  # Weights are only allocated when needed.
+            self._weights = np.zeros(self._size, dtype=np.float32)
+
+        return self._weights
+
+    @property
+    def colors(self):
+        if self._colors is None:
+            self.reset_colors()  # Colors are only allocated when needed.
+
+        return self._colors
+
+    @property
+    def has_colors(self):
+        return self._colors is not None
+
+    @property
+    def nbytes(self):
+        return (self._states.nbytes + self.parents.nbytes
+                + self.weights.nbytes + self.colors.nbytes)
+
+    def __init__(self, width: int, height: int, states=None, weights=None):
+        self._width, self._height = width, height
+        self._size = width * height
+
+        if states is None:
+            states = np.zeros(self._size, dtype=np.int8)
+        elif states.shape != (self._size,) or states.dtype != np.int8:
+            raise ValueError("'states' must be a flat int8 array of the "
+                             + "grid's size.")
+
+        if weights is not None and (weights.shape != (self._size,)
+                                    or weights.dtype != np.float32):
+            raise ValueError("'weights' must be a flat float32 array of the "
+                             + "grid's size.")
+
+        self._states, self._weights = states, weights
+        self._parents = self._colors = None
+
+    def index(self, x: int, y: int) -> int:
+        """Returns the flat index of the cell at the given coordinates."""
+
+        return y * self._width + x
+
+    def node(self, x: int, y: int) -> Node:
+        """Returns a node view of the cell at the given coordinates."""
+
+        return Node(self, y * self._width + x)
+
+    def node_at(self, index: int) -> Node:
+        """Returns a node view of the cell at the given flat index."""
+
+        return Node(self, index)
+
+    def adjacency(self) -> tuple:
+        """Returns the adjacency index of the passable cells of the grid.
+
+        The index is stored in CSR (compressed sparse row) format: the
+        neighbors of the cell with flat index `i` are the elements of
+        `neighbors[offsets[i]:offsets[i + 1]]`, sorted as top, right, bottom
+        and left. Only non-wall cells and their non-wall neighbors are
+        indexed.
+        """
+
+        cells = np.arange(self._size, dtype=np.int32)
+        ys, xs = np.divmod(cells, self._width)
+        passable = self._states != 0
+
+        neighbors = np.stack((
+            cells - self._width,  # Top
+            cells + 1,            # Right
+            cells + self._width,  # Bottom
+            cells - 1             # Left
+        ), axis=1)
+        valid = np.stack((
+            ys > 0, xs < self._width - 1, ys < self._height - 1, xs > 0
+        ), axis=1) & passable[:, None]
+        valid[valid] = passable[neighbors[valid]]
+
+        offsets = np.zeros(self._size + 1, dtype=np.int32)
+        np.cumsum(valid.sum(axis=1), out=offsets[1:])
+
+        return offsets, neighbors[valid]
+
+    def replace_state(self, old: int, new: int, indices=None) -> None:
+        """Changes the state of every cell in a given state at once.
+
+        The color of the affected cells is reset to the new state's one.
+
+        Parameters:
+        -----------
+         - old : int
+            State of the cells that will be modified.
+         - new : int
+            New state value.
+         - indices : iterable (default=None)
+            Flat indices of the only cells that will be considered. If not
+            given, the whole grid is scanned.
+        """
+
+        if indices is None:
+            cells = self._states == old
+        else:
+            cells = np.asarray(indices, dtype=np.intp)
+            cells = cells[self._states[cells] == old]
+
+        self._states[cells] = new
+        self.colors[cells] = NodeBase.STATE_COLOR[new]
+
+    def reset_colors(self) -> None:
+        """Sets the color of every cell to its state's one at once."""
+
+        palette = np.zeros((256, 3), dtype=np.uint8)
+
+        for state, color in NodeBase.STATE_COLOR.items():
+            palette[state % 256] = color
+
+        self._colors = palette[self._states.view(np.uint8)]
+
+    def __repr__(self):
+        return f"<({self._width}x{self._height}) Grid instance>"
@@ -2,8 +2,8 @@
 
 This module contains two classes: one of them is a generic Maze interface that
 contains basic attributes and methods, while the other is a specific maze
-implementation that uses a 2D array as a data structure and contains methods
-that allow path generation and searching.
+implementation that uses a typed array grid as a data structure and contains
+methods that allow path generation and searching.
 
 Author:
 -------
@@ -11,13 +11,23 @@ Author:
 """
 
 
+from array import array
+from collections import OrderedDict
+from math import inf
 from os import mkdir, path
-from random import randint, randrange, sample
-from time import time
+from random import Random, randrange
+from struct import Struct
+from sys import stdout
+from time import perf_counter, time
 
-from PIL import Image, ImageDraw
-from utils.internal.frontier import QueueFrontier, StackFrontier
-from utils.internal.node import Node
+import numpy as np
+from PIL import GifImagePlugin, Image
+from utils.internal.frontier import (BucketQueueFrontier,
+                                     PriorityQueueFrontier, QueueFrontier,
+                                     StackFrontier)
+from utils.internal.grid import Grid
+from utils.internal.node import Node, NodeBase
+from utils.internal.stats import SearchStats
 
 
 class MazeBase:
@@ -32,6 +42,14 @@ class MazeBase:
         The dimensions of the maze. If an integer is passed, the maze will be
         square. If a tuple is passed, the first element will be the width and
         the second element will be the height.
+     - seed: int (default=None)
+        The seed of the maze's random number generator, which must fit in a
+        signed 64-bit integer. If not given, a random one is chosen. The same
+        dimensions and seed always generate the same maze.
+     - grid: Grid (default=None)
+        Cell storage of the maze, which is used without being copied. If
+        given, the start node is not placed, since it is already part of the
+        cell states (see `Maze.load`).
     """
 
     IMAGE_DIRECTORY = "image_cache"
@@ -73,27 +91,61 @@ class MazeBase:
 
         self._width, self._height = self._dimensions  # Unpacks the tuple.
 
-    def __init__(self, dimensions):
+    @property
+    def seed(self):
+        return self._seed
+
+    @property
+    def count(self):
+        # Searches stopped before their end are also counted:
+        self._count["explored"] = len(self._explored)
+
+        # Lazily loaded mazes count every non-wall node but the start:
+        if self._count["path"] is None:
+            self._count["path"] = int(
+                np.count_nonzero(self._grid.states != 0)
+            ) - 1
+
+        return dict(self._count)
+
+    def __init__(self, dimensions, seed=None, grid=None):
         self.dimensions = dimensions
 
-        # Note: the row and column indices are swapped due to the fact that
-        #   each column represents an x-coordinate and each row represents a
-        #   y-coordinate.
-        self._node_matrix = [
-            [Node(column, row) for column in range(self._width)]
-            for row in range(self._height)
-        ]
-        self._node_list = [node for row in self._node_matrix for node in row]
+        # Each maze has its own generator, so that it can be reproduced:
+        if seed is None:
+            seed = randrange(2 ** 32)
+        elif not isinstance(seed, (int, np.integer)):
+            raise TypeError("'seed' must be an integer.")
+        elif not -2 ** 63 <= seed < 2 ** 63:
+            raise ValueError("'seed' must fit in a signed 64-bit integer.")
+
+        self._seed = int(seed)
+        self._random = Random(self._seed)
+
+        # Cell attributes are stored in typed arrays, nodes are just views:
+        self._grid = Grid(self._width, self._height) if grid is None else grid
 
         # Start node setting:
-        self._start = self._node_matrix[
-            randrange(0, self._height)
-        ][randrange(0, self._width)]
-        self._start.set_state(-10)
+        self._start = self._end = None  # The end is set with the path.
+        if grid is None:
+            start_y = self._random.randrange(0, self._height)
+            self._start = self._grid.node(
+                self._random.randrange(0, self._width), start_y
+            )
+            self._start.set_state(-10)
 
         # Maze statistics setting:
-        self._explored_nodes, self.optimal_path = [], []
+        # Exploration order (as flat indices) and optimal path:
+        self._explored, self.optimal_path = array("i"), []
         self._is_generated = self._is_explored = False
+        self._adjacency = None  # Built once the path is generated.
+
+        # Search instrumentation (see `SearchStats`):
+        self.stats, self.expansion_callback = SearchStats(), None
+        self.stage_timing = True
+
+        # Distance fields by maze version and target (see `distance_field`):
+        self._version, self._distance_cache = 0, OrderedDict()
         self._count = {
             "path": 0,
             "explored": 0,
@@ -104,7 +156,14 @@ class MazeBase:
 
 
 class Search:
-    """Contains search algorithms and methods related to maze exploration."""
+    """Contains search algorithms and methods related to maze exploration.
+
+    Every search stores its metrics in the `stats` attribute (see
+    `SearchStats`). If the `expansion_callback` attribute is set, it is called
+    with each expanded node and the statistics of the running search. Setting
+    the `stage_timing` attribute to False skips the timing of each neighbor
+    lookup and frontier operation, which makes searches faster.
+    """
 
     @staticmethod
     def manhattan_distance(start: Node, end: Node) -> int:
@@ -145,21 +204,35 @@ class Search:
         unexplored neighbors and repeats the process.
         """
 
-        if self._is_explored:
-            self._reset_explored_nodes()
+        return self._run_search(self.iter_depth_first_search())
+
+    def iter_depth_first_search(self):
+        """Step-wise Depth-First Search method (see `depth_first_search`).
+
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted, so the search can be
+        stopped at any step without paying for them.
+        """
+
+        stats = self._start_search()
 
         frontier = StackFrontier()
         frontier.add(self._start)
-        self._is_explored, has_end = True, False
+        stats.enqueue((self._start,))
+        has_end = False
 
         while not (frontier.is_empty() or has_end):
-            self._explored_nodes.append(node := frontier.remove())
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
 
             if node.state != -10:
-                node.set_state(2)
+                node.set_state(2, set_color=False)
 
             neighbors = [
-                node for node in self._get_neighbors(node)
+                node for node in self._get_path_neighbors(node)
                 if node.state in (1, 10)  # If node is unexplored or the end.
             ]
 
@@ -167,16 +240,19 @@ class Search:
                 neighbor.set_parent(node)
 
                 if neighbor.state == self._end.state:
-                    self._explored_nodes.append(self._end)
+                    self._explored.append(self._end.index)
                     has_end = True
                     break
 
+            clock = stats.clock()
             frontier.add(neighbors)
+            stats.frontier_time += stats.clock() - clock
+            stats.enqueue(neighbors)
 
-        self._count["explored"] = len(self._explored_nodes)
-        self._set_node_color()
-        self._get_optimal_path()
-        return has_end
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        return self._finish_search(has_end)
 
     def breadth_first_search(self) -> bool:
         """Breadth-First Search method.
@@ -187,38 +263,133 @@ class Search:
         preventing dead-end search processes.
         """
 
-        if self._is_explored:
-            self._reset_explored_nodes()
+        return self._run_search(self.iter_breadth_first_search())
+
+    def iter_breadth_first_search(self):
+        """Step-wise Breadth-First Search method (see `breadth_first_search`).
+
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted.
+        """
+
+        stats = self._start_search()
 
         frontier = QueueFrontier()
         frontier.add(self._start)
-        self._is_explored, has_end = True, False
+        stats.enqueue((self._start,))
+        # Bitmap of the queued nodes, which prevents queueing a node twice:
+        queued = bytearray(self._grid.size)
+        queued[self._start.index] = 1
+        has_end = False
 
         while not (frontier.is_empty() or has_end):
-            self._explored_nodes.append(node := frontier.remove())
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
 
             if node.state != -10:
-                node.set_state(2)
+                node.set_state(2, set_color=False)
 
             neighbors = [
-                node for node in self._get_neighbors(node)
+                node for node in self._get_path_neighbors(node)
                 if node.state in (1, 10)  # If node is unexplored or the end.
+                and not queued[node.index]
             ]
 
             for neighbor in neighbors:
                 neighbor.set_parent(node)
+                queued[neighbor.index] = 1
 
                 if neighbor.state == self._end.state:
-                    self._explored_nodes.append(self._end)
+                    self._explored.append(self._end.index)
                     has_end = True
                     break
 
+            clock = stats.clock()
             frontier.add(neighbors)
+            stats.frontier_time += stats.clock() - clock
+            stats.enqueue(neighbors)
 
-        self._count["explored"] = len(self._explored_nodes)
-        self._set_node_color()
-        self._get_optimal_path()
-        return has_end
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        return self._finish_search(has_end)
+
+    def bidirectional_search(self) -> bool:
+        """Bidirectional Breadth-First Search method.
+
+        Runs two breadth-first searches at the same time, one from the start
+        and the other one from the end, expanding a whole level of the
+        smallest frontier each time. The search stops when both of them meet,
+        so two small regions are explored instead of a large one (around half
+        of the nodes on grids, even less on branching corridors). The path
+        found is also optimal.
+        """
+
+        return self._run_search(self.iter_bidirectional_search())
+
+    def iter_bidirectional_search(self):
+        """Step-wise Bidirectional Search method (see `bidirectional_search`).
+
+        Yields a tuple with each expanded node and the amount of discovered
+        nodes of both searches that are pending expansion. Explored nodes are
+        colored and the optimal path is determined once the iterator is
+        exhausted.
+        """
+
+        stats = self._start_search()
+
+        # Distance of each discovered node to the start and to the end:
+        distances = ({self._start.index: 0}, {self._end.index: 0})
+        frontiers = [[self._start], [self._end]]
+        backward_parents = {}  # Links towards the end (stitched afterwards).
+        stats.enqueue((self._start, self._end))
+        meeting = None
+
+        while frontiers[0] and frontiers[1] and meeting is None:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own, other = distances[side], distances[1 - side]
+            pending = len(frontiers[0]) + len(frontiers[1])
+            level = []
+
+            for node in frontiers[side]:
+                self._explored.append(node.index)
+
+                if node.state not in (-10, 10):
+                    node.set_state(2, set_color=False)
+
+                for neighbor in self._get_path_neighbors(node):
+
+                    # The shortest connection found in the level is kept:
+                    if neighbor.index in other:
+                        length = own[node.index] + 1 + other[neighbor.index]
+
+                        if meeting is None or length < meeting[0]:
+                            meeting = (length, node, neighbor) if side == 0 \
+                                else (length, neighbor, node)
+
+                    elif neighbor.index not in own:
+                        own[neighbor.index] = own[node.index] + 1
+                        level.append(neighbor)
+                        stats.enqueue((neighbor,))
+
+                        if side == 0:
+                            neighbor.set_parent(node)
+                        else:
+                            backward_parents[neighbor.index] = node.index
+
+                pending -= 1
+                self._expand(node, pending + len(level))
+                yield node, pending + len(level)
+
+            frontiers[side] = level
+
+        if meeting is not None:
+            self._stitch_path(meeting[1], meeting[2], backward_parents)
+
+        return self._finish_search(meeting is not None)
 
     def greedy_best_first_search(self) -> bool:
         """Greedy Best-First Search method.
@@ -229,24 +400,39 @@ class Search:
         end node.
         """
 
-        if self._is_explored:
-            self._reset_explored_nodes()
+        return self._run_search(self.iter_greedy_best_first_search())
+
+    def iter_greedy_best_first_search(self):
+        """Step-wise Greedy Best-First Search method (see
+        `greedy_best_first_search`).
 
-        # Computes the manhattan distance for each node in the maze:
-        for node in self._node_list:
-            node.weight = self.manhattan_distance(node, self._end)
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted.
+        """
 
-        frontier = [self._start]  # TODO: maybe use a PriorityQueueFrontier?
-        self._is_explored, has_end = True, False
+        stats = self._start_search()
 
-        while len(frontier) >= 1 and not has_end:
-            self._explored_nodes.append(node := frontier.pop())
+        # Nodes are sorted by their manhattan distance to the end (node
+        #   weights are left untouched, since they represent step costs):
+        frontier = PriorityQueueFrontier(
+            key=lambda node: self.manhattan_distance(node, self._end)
+        )
+        frontier.add(self._start)
+        stats.enqueue((self._start,))
+        has_end = False
+
+        while not (frontier.is_empty() or has_end):
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
 
             if node.state != -10:
-                node.set_state(2)
+                node.set_state(2, set_color=False)
 
             neighbors = [
-                node for node in self._get_neighbors(node)
+                node for node in self._get_path_neighbors(node)
                 if node.state in (1, 10)  # If node is unexplored or the end.
             ]
 
@@ -254,18 +440,19 @@ class Search:
                 neighbor.set_parent(node)
 
                 if neighbor.state == self._end.state:
-                    self._explored_nodes.append(self._end)
+                    self._explored.append(self._end.index)
                     has_end = True
                     break
 
-            frontier.extend(neighbors)
-            # Sort nodes by their weight (manhattan distance to the end):
-            frontier = sorted(frontier, reverse=True, key=lambda x: x.weight)
+            clock = stats.clock()
+            frontier.add(neighbors)
+            stats.frontier_time += stats.clock() - clock
+            stats.enqueue(neighbors)
 
-        self._count["explored"] = len(self._explored_nodes)
-        self._set_node_color()
-        self._get_optimal_path()
-        return has_end
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        return self._finish_search(has_end)
 
     def radial_search(self) -> bool:
         """Radial Search method.
@@ -276,23 +463,37 @@ class Search:
         end node.
         """
 
-        if self._is_explored:
-            self._reset_explored_nodes()
+        return self._run_search(self.iter_radial_search())
 
-        for node in self._node_list:
-            node.weight = self.radial_distance(node, self._end)
+    def iter_radial_search(self):
+        """Step-wise Radial Search method (see `radial_search`).
 
-        frontier = [self._start]  # TODO: maybe use a PriorityQueueFrontier?
-        self._is_explored, has_end = True, False
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted.
+        """
 
-        while len(frontier) >= 1 and not has_end:
-            self._explored_nodes.append(node := frontier.pop())
+        stats = self._start_search()
+
+        # Nodes are sorted by their radial distance to the end:
+        frontier = PriorityQueueFrontier(
+            key=lambda node: self.radial_distance(node, self._end)
+        )
+        frontier.add(self._start)
+        stats.enqueue((self._start,))
+        has_end = False
+
+        while not (frontier.is_empty() or has_end):
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
 
             if node.state != -10:
-                node.set_state(2)
+                node.set_state(2, set_color=False)
 
             neighbors = [
-                node for node in self._get_neighbors(node)
+                node for node in self._get_path_neighbors(node)
                 if node.state in (1, 10)  # If node is unexplored or the end.
             ]
 
@@ -300,17 +501,607 @@ class Search:
                 neighbor.set_parent(node)
 
                 if neighbor.state == self._end.state:
-                    self._explored_nodes.append(self._end)
+                    self._explored.append(self._end.index)
                     has_end = True
                     break
 
-            frontier.extend(neighbors)
-            # Sort nodes by their weight (radial distance to the end):
-            frontier = sorted(frontier, reverse=True, key=lambda x: x.weight)
+            clock = stats.clock()
+            frontier.add(neighbors)
+            stats.frontier_time += stats.clock() - clock
+            stats.enqueue(neighbors)
+
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        return self._finish_search(has_end)
+
+    def a_star_search(self, heuristic=None) -> bool:
+        """A* Search method.
+
+        Sorts the frontier by the cost of the path from the start to each
+        node plus the heuristic estimate of the remaining distance to the end.
+        Each step costs one plus the weight of the entered node. As long as
+        the heuristic never overestimates the remaining cost, the optimal path
+        is found while expanding far fewer nodes than uninformed searches.
+        Expanded nodes are expanded again if a cheaper path to them is found
+        later, so the heuristic does not need to be consistent.
+
+        Parameters:
+        -----------
+         - heuristic : callable (default=manhattan_distance)
+            Function that takes a node and the end node and returns the
+            estimated cost between them (i.e. `manhattan_distance`,
+            `radial_distance` or any user-defined callable), which must never
+            overestimate it.
+        """
+
+        return self._run_search(self.iter_a_star_search(heuristic))
+
+    def iter_a_star_search(self, heuristic=None):
+        """Step-wise A* Search method (see `a_star_search`).
+
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted.
+
+        Parameters:
+        -----------
+         - heuristic : callable (default=manhattan_distance)
+            Function that takes a node and the end node and returns the
+            estimated cost between them.
+        """
+
+        if heuristic is None:
+            heuristic = self.manhattan_distance
+
+        elif not callable(heuristic):
+            raise TypeError("'heuristic' must be a callable object.")
+
+        return (yield from self._iter_cost_search(
+            PriorityQueueFrontier(), heuristic
+        ))
+
+    def dijkstra_search(self, bucket=False) -> bool:
+        """Dijkstra Search method.
+
+        Sorts the frontier by the cost of the path from the start to each
+        node, where each step costs one plus the terrain cost of the entered
+        node (see `set_terrain`). Nodes are expanded in order of increasing
+        cost, so the path found has the lowest total cost.
+
+        Parameters:
+        -----------
+         - bucket : bool (default=False)
+            Determines whether the frontier is a bucket queue instead of a
+            binary heap, which is faster but requires integer terrain costs.
+        """
+
+        return self._run_search(self.iter_dijkstra_search(bucket))
+
+    def iter_dijkstra_search(self, bucket=False):
+        """Step-wise Dijkstra Search method (see `dijkstra_search`).
+
+        Yields a tuple with each expanded node and the size of the frontier
+        after its expansion. Explored nodes are colored and the optimal path
+        is determined once the iterator is exhausted.
+
+        Parameters:
+        -----------
+         - bucket : bool (default=False)
+            Determines whether the frontier is a bucket queue instead of a
+            binary heap.
+        """
+
+        if not bucket:
+            frontier = PriorityQueueFrontier()
+
+        else:
+            weights = self._grid.weights
+
+            if (weights != np.round(weights)).any():
+                raise ValueError("bucket queues require integer terrain "
+                                 + "costs.")
+
+            frontier = BucketQueueFrontier(1 + int(weights.max(initial=0)))
+
+        return (yield from self._iter_cost_search(frontier))
+
+    def _iter_cost_search(self, frontier, heuristic=None):
+        """Step-wise lowest cost search (see `a_star_search`).
+
+        Parameters:
+        -----------
+         - frontier : Frontier
+            Empty frontier that supports priorities.
+         - heuristic : callable (default=None)
+            Function that takes a node and the end node and returns the
+            estimated cost between them. If not given, nodes are sorted by
+            their cost only.
+        """
+
+        stats = self._start_search()
+
+        # Cost of the best known path to each node, by flat index:
+        costs = {self._start.index: 0}
+        frontier.add(self._start, 0 if heuristic is None
+                     else heuristic(self._start, self._end))
+        stats.enqueue((self._start,))
+        has_end = False
+
+        while not (frontier.is_empty() or has_end):
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
+
+            # The end is checked on removal, so that its cost is minimal:
+            if node.index == self._end.index:
+                has_end = True
+                break
+
+            if node.state != -10:
+                node.set_state(2, set_color=False)
+
+            # Expanded nodes are reopened if a cheaper path to them is found,
+            #   which only happens with inconsistent heuristics:
+            for neighbor in self._get_path_neighbors(node):
+                cost = costs[node.index] + 1 + neighbor.weight
+
+                if cost < costs.get(neighbor.index, inf):
+                    costs[neighbor.index] = cost
+                    neighbor.set_parent(node)
+
+                    clock = stats.clock()
+                    frontier.add(neighbor, cost if heuristic is None
+                                 else cost + heuristic(neighbor, self._end))
+                    stats.frontier_time += stats.clock() - clock
+                    stats.enqueue((neighbor,))
+
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        return self._finish_search(has_end)
+
+    def _start_search(self) -> SearchStats:
+        """Prepares the maze for a new search and returns its statistics.
+
+        Nodes explored by a previous search are reset, and a new
+        `SearchStats` instance is stored in the `stats` attribute.
+        """
+
+        if self._is_explored:
+            self._reset_explored_nodes()
+
+        self._is_explored = True
+        self.stats = SearchStats(self._grid.size, self.stage_timing)
+        self._search_start = perf_counter()
+
+        return self.stats
+
+    def _expand(self, node: Node, frontier_size: int) -> None:
+        """Records the expansion of a node and notifies the callback.
+
+        Parameters:
+        -----------
+         - node : Node
+            The expanded node.
+         - frontier_size : int
+            The amount of nodes in the frontier after the expansion.
+        """
+
+        self.stats.expand(frontier_size)
+
+        if self.expansion_callback is not None:
+            self.expansion_callback(node, self.stats)
+
+    def jump_point_search(self) -> bool:
+        """Jump Point Search method.
+
+        A* search variant for uniform-cost grids with orthogonal movement.
+        Instead of adding every neighbor to the frontier, the search jumps
+        in a straight line from each node until it finds a jump point: the
+        end, or a node where a new shortest path may branch off (a side
+        opening that was closed right behind it, or a vertical jump that
+        reaches a horizontal jump point). Symmetric paths that only differ in
+        the order of their moves are pruned, so only the turns and junctions
+        of long corridors are expanded, while the path found is as short as
+        the breadth-first search one. Node weights are not considered.
+        """
+
+        return self._run_search(self.iter_jump_point_search())
+
+    def iter_jump_point_search(self):
+        """Step-wise Jump Point Search method (see `jump_point_search`).
+
+        Yields a tuple with each expanded jump point and the size of the
+        frontier after its expansion. Explored nodes are colored and the
+        optimal path is determined once the iterator is exhausted.
+        """
+
+        stats = self._start_search()
+
+        # Cells are indexed in a grid padded with walls, so that jumps do
+        #   not need bounds checking:
+        width = self._width + 2
+        passable = np.zeros((self._height + 2, width), dtype=np.uint8)
+        passable[1:-1, 1:-1] = (self._grid.states != 0).reshape(
+            self._height, self._width)
+        passable = passable.tobytes()
+
+        def padded(index: int) -> int:
+            return index + (index // self._width) * 2 + width + 1
+
+        def flat(index: int) -> int:
+            return index - (index // width - 1) * 2 - width - 1
+
+        start, end = padded(self._start.index), padded(self._end.index)
+        costs = {start: 0}  # Cost of the best known path to each jump point.
+        frontier = PriorityQueueFrontier()
+        frontier.add(self._start, self.manhattan_distance(
+            self._start, self._end
+        ))
+        stats.enqueue((self._start,))
+        has_end = False
+
+        while not (frontier.is_empty() or has_end):
+            clock = stats.clock()
+            node = frontier.remove()
+            stats.frontier_time += stats.clock() - clock
+            self._explored.append(node.index)
+
+            if node.index == self._end.index:
+                has_end = True
+                break
+
+            if node.state != -10:
+                node.set_state(2, set_color=False)
+
+            # Nodes other than the start only continue their own direction
+            #   or turn, since going back can never be shorter:
+            current = padded(node.index)
+            parent = self._grid.parents.item(node.index)
+
+            if node.index == self._start.index or parent < 0:
+                directions = (-width, 1, width, -1)
+            else:
+                step = current - padded(parent)
+                step = (step > 0) - (step < 0) if abs(step) < width \
+                    else width if step > 0 else -width
+                directions = (step, width, -width) if abs(step) == 1 \
+                    else (step, 1, -1)
+
+            clock = stats.clock()
+            jump_points = [
+                point for point in (
+                    self._jump(current, direction, end, passable, width)
+                    for direction in directions
+                ) if point >= 0
+            ]
+            stats.neighbor_time += stats.clock() - clock
+
+            for point in jump_points:
+                neighbor = self._grid.node_at(flat(point))
+                cost = costs[current] + abs(
+                    neighbor.x - node.x) + abs(neighbor.y - node.y)
+
+                if neighbor.state in (1, 10) \
+                        and cost < costs.get(point, inf):
+                    costs[point] = cost
+                    neighbor.set_parent(node)
+
+                    clock = stats.clock()
+                    frontier.add(neighbor, cost + self.manhattan_distance(
+                        neighbor, self._end
+                    ))
+                    stats.frontier_time += stats.clock() - clock
+                    stats.enqueue((neighbor,))
+
+            self._expand(node, len(frontier))
+            yield node, len(frontier)
+
+        if has_end:
+            self._fill_jumps()
+
+        return self._finish_search(has_end)
+
+    @staticmethod
+    def _jump(index: int, step: int, end: int, passable: bytes,
+              width: int) -> int:
+        """Returns the next jump point in a direction, or -1 if none exists.
+
+        Parameters:
+        -----------
+         - index : int
+            Padded index of the cell the jump starts from.
+         - step : int
+            Padded index difference of a single move in the jump direction.
+         - end : int
+            Padded index of the end node.
+         - passable : bytes
+            Non-wall flag of every cell of the padded grid.
+         - width : int
+            Width of the padded grid.
+        """
+
+        side = width if abs(step) == 1 else 1  # Perpendicular direction.
+
+        while True:
+            index += step
+
+            if not passable[index]:
+                return -1
+
+            if index == end:
+                return index
+
+            # Side openings that were closed behind force a jump point:
+            if passable[index + side] and not passable[index - step + side] \
+                    or passable[index - side] \
+                    and not passable[index - step - side]:
+                return index
+
+            # Vertical jumps also stop where a horizontal jump would:
+            if side == 1 and (
+                Search._jump(index, 1, end, passable, width) >= 0
+                or Search._jump(index, -1, end, passable, width) >= 0
+            ):
+                return index
+
+    def _fill_jumps(self) -> None:
+        """Links every node skipped by the jumps of the path to the end.
+
+        The parent of each jump point is the previous jump point, so the
+        nodes of the straight segment between them are linked one by one,
+        making the path to the end continuous.
+        """
+
+        parents, index = self._grid.parents, self._end.index
+
+        while index != self._start.index:
+            parent = parents.item(index)
+            step = (parent > index) - (parent < index)
+            step *= 1 if abs(parent - index) < self._width \
+                and parent // self._width == index // self._width \
+                else self._width
+
+            while index != parent:
+                parents[index] = index + step
+                index += step
+
+    def distance_field(self, target=None) -> np.ndarray:
+        """Returns the path distance of every cell to a target node.
+
+        The field is computed once by a breadth-first search from the target
+        and cached, so that repeated queries towards the same target are
+        answered without searching again. Walls and unreachable cells get a
+        distance of -1. Node weights are not considered.
+
+        The returned array is shared by every caller, so it is read-only.
+
+        Parameters:
+        -----------
+         - target : Node, int (default=None)
+            The target node or its flat index, which cannot be a wall.
+            Defaults to the end node.
+        """
+
+        target = self._get_query_index(self._end if target is None else target)
+        key = (self._version, target)
+
+        if self._grid.states[target] == 0:
+            raise ValueError(f"node index {target} belongs to a wall.")
+
+        if key in self._distance_cache:
+            self._distance_cache.move_to_end(key)
+
+        else:
+            distances = self._get_distances(target)
+            distances.flags.writeable = False
+            self._distance_cache[key] = distances
+
+            # The least recently used field is evicted:
+            if len(self._distance_cache) > self.DISTANCE_CACHE_SIZE:
+                self._distance_cache.popitem(last=False)
+
+        return self._distance_cache[key]
+
+    def shortest_path(self, start, target=None) -> np.ndarray:
+        """Returns a shortest path from a node to a target node.
+
+        The path is read off the cached distance field of the target (see
+        `distance_field`) by stepping to a neighbor one step closer to the
+        target each time, so it only takes as many steps as the path length.
+        The maze is not modified (i.e. explored nodes and `optimal_path` are
+        left untouched).
+
+        Parameters:
+        -----------
+         - start : Node, int
+            The first node of the path or its flat index.
+         - target : Node, int (default=None)
+            The last node of the path or its flat index, which cannot be a
+            wall. Defaults to the end node.
+
+        Returns the flat indices of the path nodes, from the start to the
+        target, as an int32 array. The array is empty if the target cannot be
+        reached.
+        """
+
+        distances = self.distance_field(target)
+        index = self._get_query_index(start)
+        distance = int(distances[index])
+
+        if distance < 0:
+            return np.empty(0, dtype=np.int32)
+
+        offsets, neighbors = self._get_adjacency()
+        path = np.empty(distance + 1, dtype=np.int32)
+        path[0] = index
+
+        for step in range(1, distance + 1):
+            candidates = neighbors[offsets[index]:offsets[index + 1]]
+            index = candidates[distances[candidates] == distance - step][0]
+            path[step] = index
+
+        return path
+
+    def solve_many(self, pairs, algorithm="breadth_first_search") -> list:
+        """Finds a path for each pair of start and end coordinates.
+
+        The maze is not modified: neither its explored nodes, optimal path
+        nor colors change. Shortest path queries (`breadth_first_search` and
+        `bidirectional_search`) are answered from the cached distance field
+        of each end (see `shortest_path`), so queries with the same end share
+        a single search. Any other algorithm runs on a private copy of the
+        maze's cell states, which is created once and shares the adjacency
+        index of the maze.
+
+        Parameters:
+        -----------
+         - pairs : iterable
+            Pairs of `(x, y)` coordinates of the start and the end of each
+            query.
+         - algorithm : str (default="breadth_first_search")
+            The name of the search method used for each query.
+
+        Returns a list with the path of each query, in the same order, as an
+        int32 array with the flat indices of its nodes. The array is empty if
+        the end cannot be reached.
+        """
+
+        if not callable(getattr(self, f"iter_{algorithm}", None)):
+            raise ValueError(f"unknown search algorithm '{algorithm}'.")
+
+        queries = [
+            (self._get_query_cell(start), self._get_query_cell(end))
+            for start, end in pairs
+        ]
+        paths = [None] * len(queries)
+
+        if algorithm in ("breadth_first_search", "bidirectional_search"):
+
+            # Queries are grouped by their end, so that each field is only
+            #   computed once regardless of the cache size:
+            for number in sorted(range(len(queries)),
+                                 key=lambda number: queries[number][1]):
+                paths[number] = self.shortest_path(*queries[number])
+
+            return paths
+
+        maze = self._from_states(
+            self._dimensions, self._seed, self._get_path_states(),
+            self._start.index, -1 if self._end is None else self._end.index,
+            self.shuffle_neighbors, self._get_adjacency(), self._grid.weights
+        )
+
+        for number, (start, end) in enumerate(queries):
+            if start == end:
+                paths[number] = np.array([start], dtype=np.int32)
+                continue
+
+            maze._set_endpoints(start, end)
+
+            if maze._run_search(getattr(maze, f"iter_{algorithm}")()):
+                paths[number] = np.array(
+                    [node.index for node in maze.optimal_path], dtype=np.int32
+                )
+            else:
+                paths[number] = np.empty(0, dtype=np.int32)
+
+        return paths
+
+    def _set_endpoints(self, start: int, end: int) -> None:
+        """Moves the start and end nodes, discarding the last search.
+
+        Parameters:
+        -----------
+         - start : int
+            Flat index of the new start node.
+         - end : int
+            Flat index of the new end node.
+        """
+
+        self._reset_explored_nodes()
+        self._is_explored = False
+
+        for node in (self._start, self._end):
+            if node is not None:
+                node.set_state(1)
+
+        self._start = self._grid.node_at(start)
+        self._end = self._grid.node_at(end)
+        self._start.set_state(-10)
+        self._end.set_state(10)
+
+    def _get_query_cell(self, coordinates) -> int:
+        """Returns the flat index of the non-wall cell at some coordinates."""
+
+        x, y = coordinates
 
-        self._count["explored"] = len(self._explored_nodes)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise ValueError(f"coordinates {coordinates} are out of the maze.")
+
+        if self._grid.states[y * self._width + x] == 0:
+            raise ValueError(f"coordinates {coordinates} belong to a wall.")
+
+        return y * self._width + x
+
+    def _get_query_index(self, node) -> int:
+        """Returns the flat index of a node given as a Node or an index."""
+
+        index = node.index if isinstance(node, Node) else node
+
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError("nodes must be given as Node objects or indices.")
+
+        if not 0 <= index < self._width * self._height:
+            raise ValueError(f"node index {index} is out of the maze.")
+
+        return int(index)
+
+    def _invalidate_distances(self) -> None:
+        """Discards every cached distance field after the path changes."""
+
+        self._version += 1
+        self._distance_cache.clear()
+
+    @staticmethod
+    def _run_search(search) -> bool:
+        """Consumes a step-wise search and returns whether the end was found.
+
+        Parameters:
+        -----------
+         - search : generator
+            Step-wise search method (i.e. `iter_breadth_first_search()`).
+        """
+
+        while True:
+            try:
+                next(search)
+            except StopIteration as result:
+                return result.value
+
+    def _finish_search(self, has_end: bool) -> bool:
+        """Colors the explored nodes and determines the optimal path.
+
+        This method is only run once a step-wise search is exhausted.
+
+        Parameters:
+        -----------
+         - has_end : bool
+            Whether the search found the end node or not.
+        """
+
+        clock = perf_counter()
+        self._count["explored"] = len(self._explored)
         self._set_node_color()
-        self._get_optimal_path()
+
+        if has_end:
+            self._get_optimal_path()
+
+        self.stats.finish_time = perf_counter() - clock
+        self.stats.total_time = perf_counter() - self._search_start
+
         return has_end
 
 
@@ -326,62 +1117,128 @@ class Maze(MazeBase, Search):
         The dimensions of the maze. If an integer is passed, the maze will be
         square. If a tuple is passed, the first element will be the width and
         the second element will be the height.
+     - seed: int (default=None)
+        The seed of the maze's random number generator. If not given, a
+        random one is chosen. The same dimensions and seed always generate
+        the same maze.
+     - vectorized: bool (default=True)
+        Determines whether the path is generated with NumPy array operations
+        or with the original node-by-node algorithm.
+     - shuffle_neighbors: bool (default=True)
+        Determines whether the neighbors of each node are visited in a random
+        order during searches. If disabled, searches are deterministic and
+        skip the shuffle entirely.
+     - farthest_end: bool (default=False)
+        Determines whether the end is placed on the path node with the longest
+        path from the start, instead of the farthest one in manhattan
+        distance.
     """
 
-    def __init__(self, dimensions):
+    # Serialization header (width, height, start, end and seed):
+    HEADER = Struct("<IIiiq")
+
+    # File header (magic number, format version and flags):
+    FILE_HEADER = Struct("<4sBB2x")
+    FILE_MAGIC, FILE_VERSION, FILE_PACKED = b"MAZE", 1, 0b1
+
+    # Maximum amount of cached distance fields (see `distance_field`):
+    DISTANCE_CACHE_SIZE = 8
+
+    # Offsets of the square neighbors of a cell, as (x, y) differences:
+    SQUARE_OFFSETS = (
+        (-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0)
+    )
+
+    def __init__(self, dimensions, seed=None, vectorized=True,
+                 shuffle_neighbors=True, farthest_end=False):
 
         # Initialize basic maze attributes and generate path:
-        super().__init__(dimensions)
-        self._generate_path()
+        super().__init__(dimensions, seed)
+        self.shuffle_neighbors = shuffle_neighbors
+        self._generate_path(vectorized=vectorized, farthest_end=farthest_end)
+
+    def set_terrain(self, costs=None, maximum=9) -> None:
+        """Sets the terrain cost of every node.
+
+        Entering a node costs one step plus its terrain cost in cost-based
+        searches (`dijkstra_search` and `a_star_search`). Costs are stored in
+        the weight array of the grid, which no search modifies.
+
+        Parameters:
+        -----------
+         - costs : np.ndarray (default=None)
+            Non-negative cost of every node, with shape (height, width) or
+            flat. If not given, random integer costs between 0 and `maximum`
+            are drawn from the maze's random number generator.
+         - maximum : int (default=9)
+            The largest random cost.
+        """
+
+        if costs is None:
+            if not isinstance(maximum, int) or maximum < 0:
+                raise ValueError("'maximum' must be a non-negative integer.")
+
+            costs = np.random.default_rng(
+                self._random.randrange(2 ** 32)
+            ).integers(0, maximum, self._grid.size, endpoint=True)
+
+        costs = np.asarray(costs, dtype=np.float32)
+
+        if costs.shape not in ((self._height, self._width),
+                               (self._grid.size,)):
+            raise ValueError("'costs' must have shape (height, width) or "
+                             + "contain one value per node.")
+
+        if not (np.isfinite(costs) & (costs >= 0)).all():
+            raise ValueError("'costs' must be finite non-negative values.")
+
+        self._grid.weights[:] = costs.reshape(-1)
 
     def _set_node_color(self):
         """Automatically sets the color of all explored nodes.
 
         The color is set based on the count of currently explored nodes and
-        the color difference between the endpoints."""
+        the color difference between the endpoints. Every color is computed
+        at once, in exploration order."""
 
         # Set the color difference between each node:
+        start = np.array(self._start.color, dtype=np.float64)
         differential = (
-            (self._end.color[0] - self._start.color[0]) /
-            self._count["explored"],
-            (self._end.color[1] - self._start.color[1]) /
-            self._count["explored"],
-            (self._end.color[2] - self._start.color[2]) /
-            self._count["explored"],
-        )
+            np.array(self._end.color, dtype=np.float64) - start
+        ) / self._count["explored"]
 
-        # Apply the color to each explored node:
-        for index, node in enumerate(self._explored_nodes):
-            if node.state not in (self._start.state, self._end.state):
-                node.set_color((
-                    int(self._start.color[0] + differential[0] * index),
-                    int(self._start.color[1] + differential[1] * index),
-                    int(self._start.color[2] + differential[2] * index)
-                ))
+        # Apply the color to each explored node but the endpoints:
+        cells = np.array(self._explored, dtype=np.intp)
+        colors = (
+            start + differential * np.arange(len(cells))[:, None]
+        ).astype(np.uint8)
+        explored = ~np.isin(self._grid.states[cells], (-10, 10))
+        self._grid.colors[cells[explored]] = colors[explored]
 
     def _reset_explored_nodes(self) -> None:
         """Converts all explored nodes back to unexplored nodes.
 
         This method also converts all optimal path nodes back to unexplored
-        and resets the corresponding node counters.
+        and resets the corresponding node counters. Only the nodes recorded by
+        the previous search are visited, so the cost of the reset depends on
+        the amount of explored nodes instead of the size of the maze.
         """
 
         # Reverts the state of every explored node to unexplored:
-        for node in self._node_list:
-            if node.state == 2:
-                node.set_state(1)
+        self._grid.replace_state(2, 1, self._explored)
 
         self._reset_optimal_nodes()
         self._count["explored"] = 0
-        self._explored_nodes.clear()
+        del self._explored[:]
 
     def _reset_optimal_nodes(self) -> None:
         """Converts all optimal nodes back to unexplored nodes."""
 
         # Reverts the state of every optimal path node to unexplored:
-        for node in self._node_list:
-            if node.state == 3:
-                node.set_state(1)
+        self._grid.replace_state(
+            3, 1, [node.index for node in self.optimal_path]
+        )
+        self.optimal_path = []
 
     def _reset_generated_nodes(self) -> None:
         """Converts every node to a wall.
@@ -390,18 +1247,19 @@ class Maze(MazeBase, Search):
         """
 
         # Reverts the state of every node to a wall one:
-        for node in self._node_list:
-            if node.state != -10:
-                node.set_state(0)
+        for state in (1, 2, 3, 10):
+            self._grid.replace_state(state, 0)
 
         self._count["path"] = 0
+        self._adjacency = None
 
     def _get_neighbors(self, node: Node) -> list:
         """Returns immediate neighbors of a node.
 
         Gets the nodes immediately next to the given coordinates (top, right,
         bottom, left). If the node is on the edge of the maze, the neighbor
-        will be None.
+        will be None. Walls are included, since the method is used during
+        path generation (see `_get_path_neighbors` for searches).
 
         Note:
         -----
@@ -423,11 +1281,50 @@ class Maze(MazeBase, Search):
 
         # Gets every neighbor node that is between the maze's boundaries:
         nodes = [
-            self._node_matrix[coord[1]][coord[0]] for coord in coordinates
+            self._grid.node(*coord) for coord in coordinates
             if 0 <= coord[0] < self._width and 0 <= coord[1] < self._height
         ]
 
-        return sample(nodes, len(nodes))
+        return self._random.sample(nodes, len(nodes))
+
+    def _get_path_neighbors(self, node: Node) -> list:
+        """Returns immediate non-wall neighbors of a node.
+
+        The neighbors are read from the adjacency index, which is built once
+        after the path generation, so no bounds or state checks are needed.
+
+        Note:
+        -----
+        If `shuffle_neighbors` is enabled, the order in which the neighbor
+        nodes are returned is set in a random way in order to prevent data
+        pre-setting. Otherwise, they are sorted as top, right, bottom, left.
+
+        Parameters:
+        -----------
+         - node: Node
+            The node whose neighbors will be returned.
+        """
+
+        clock = self.stats.clock()
+        offsets, neighbors = self._get_adjacency()
+        nodes = [
+            self._grid.node_at(index) for index in
+            neighbors[offsets[node.index]:offsets[node.index + 1]].tolist()
+        ]
+
+        if self.shuffle_neighbors:
+            self._random.shuffle(nodes)
+
+        self.stats.neighbor_time += self.stats.clock() - clock
+        return nodes
+
+    def _get_adjacency(self) -> tuple:
+        """Returns the adjacency index of the maze, building it if needed."""
+
+        if self._adjacency is None:
+            self._adjacency = self._grid.adjacency()
+
+        return self._adjacency
 
     def _get_square_neighbors(self, node: Node) -> list:
         """Returns square neighbors of a node.
@@ -454,7 +1351,7 @@ class Maze(MazeBase, Search):
 
         # Gets every neighbor node that is between the maze's boundaries:
         nodes = [
-            self._node_matrix[coord[1]][coord[0]] for coord in coordinates
+            self._grid.node(*coord) for coord in coordinates
             if 0 <= coord[0] < self._width and 0 <= coord[1] < self._height
         ]
 
@@ -464,21 +1361,46 @@ class Maze(MazeBase, Search):
         """Determines the optimal path from the end to the start node.
 
         This process is performed by reversing the search process and
-        evaluating each node's parent. The parent of the start node is None,
-        so the process stops when the start is reached.
+        evaluating each node's parent in the parent index array, so it only
+        takes as many steps as the path length. The process stops when the
+        start is reached. It must only be called once the search has reached
+        the end node.
         """
 
-        if self._end in self._explored_nodes:
-            self.optimal_path = [self._end]
-            node = self._end.parent
+        parents, index = self._grid.parents, self._end.index
+        path = [index]
+
+        while index != self._start.index:
+            path.append(index := parents.item(index))
+
+        path.reverse()
+        self._grid.states[path[1:-1]] = 3  # Colors are kept.
+        self.optimal_path = [self._grid.node_at(index) for index in path]
+
+    def _stitch_path(self, forward: Node, backward: Node,
+                     backward_parents: dict) -> None:
+        """Links the two halves of a bidirectional search.
+
+        The parent links of the backward half point towards the end, so they
+        are reversed, making every node of the path a descendant of the start.
+
+        Parameters:
+        -----------
+         - forward: Node
+            Meeting node of the search from the start.
+         - backward: Node
+            Meeting node of the search from the end.
+         - backward_parents: dict
+            Flat index of the next node towards the end, for each node
+            discovered by the search from the end.
+        """
 
-            while node.parent is not None:
-                self.optimal_path.append(node)
-                node.set_state(3, set_color=False)
-                node = node.parent
+        backward.set_parent(forward)
+        parents, index = self._grid.parents, backward.index
 
-            self.optimal_path.append(self._start)
-            self.optimal_path.reverse()
+        while index != self._end.index:
+            parents[backward_parents[index]] = index
+            index = backward_parents[index]
 
     def _randomize_divergence(self, nodes: list) -> list:
         """Randomizes the divergence during path generation process.
@@ -492,45 +1414,193 @@ class Maze(MazeBase, Search):
 
         bias = round(max(self._width, self._height) * (1 / 4))
 
-        chance = randint(
+        chance = self._random.randint(
             bias if bias <= len(nodes) else len(nodes), len(nodes)
         )
 
-        return sample(
+        return self._random.sample(
             nodes, chance if 0 <= chance <= len(nodes) else .66 * len(nodes)
         )
 
-    def _set_end_node(self, probability=1) -> None:
+    def _set_end_node(self, probability=1, farthest=False) -> None:
         """Sets the location of the end node.
 
+        The end is placed on the path node that is farthest from the start,
+        which is found at once over the distance of every path node. If no
+        path node is available, the end is not set.
+
         Parameters:
         -----------
          - probability: float (defaul=1)
             The probability of the end node being set.
+         - farthest: bool (default=False)
+            Determines whether distances are measured along the path (the
+            number of steps of the shortest path from the start) instead of
+            with the manhattan distance.
         """
 
         if not 0 <= probability <= 1:
             raise TypeError("'probability' must be a float between 0 and 1.")
 
-        if randint(0, 100) / 100 < probability:
-            path_tiles = [node for node in self._node_list if node.state == 1]
+        if self._random.random() >= probability:
+            return
+
+        if farthest:
+            distances = self._get_distances(self._start.index)
+            distances[self._grid.states != 1] = -1
+            index = int(np.argmax(distances))
+
+            if distances[index] < 0:
+                return
+
+        else:
+            tiles = np.flatnonzero(self._grid.states == 1)
+
+            if not tiles.size:
+                return
+
+            ys, xs = np.divmod(tiles, self._width)
+            index = int(tiles[np.argmax(
+                np.abs(xs - self._start.x) + np.abs(ys - self._start.y)
+            )])
+
+        self._end = self._grid.node_at(index)
+        self._end.set_state(10)
+
+    def _get_distances(self, index: int) -> np.ndarray:
+        """Returns the path distance of every cell to a given one.
+
+        Distances are computed by a breadth-first search that expands each
+        level at once. Walls and unreachable cells get a distance of -1.
+
+        Parameters:
+        -----------
+         - index: int
+            Flat index of the cell distances are measured from.
+        """
+
+        # Cells are indexed in a grid padded with walls, so that neighbors
+        #   can be computed without bounds checking:
+        width = self._width + 2
+        passable = np.zeros((self._height + 2, width), dtype=bool)
+        passable[1:-1, 1:-1] = (self._grid.states != 0).reshape(
+            self._height, self._width)
+        passable = passable.ravel()
+
+        distances = np.full(passable.size, -1, dtype=np.int32)
+        offsets = np.array((-width, 1, width, -1), dtype=np.intp)
+        y, x = divmod(index, self._width)
+        frontier = np.array([(y + 1) * width + x + 1], dtype=np.intp)
+        distances[frontier], level = 0, 0
+
+        while frontier.size:
+            level += 1
+            frontier = (frontier[:, None] + offsets).ravel()
+            frontier = np.unique(frontier[
+                passable[frontier] & (distances[frontier] < 0)
+            ])
+            distances[frontier] = level
+
+        return distances.reshape(self._height + 2, width)[1:-1, 1:-1].ravel()
 
-            self._end = path_tiles[0]
-            top_distance = self.manhattan_distance(self._end, path_tiles[0])
+    def _get_wave_neighbors(self, indices) -> np.ndarray:
+        """Returns the unique immediate neighbors of a set of cells.
+
+        Parameters:
+        -----------
+         - indices: np.ndarray
+            Flat indices of the cells whose neighbors will be returned.
+        """
 
-            for tile in path_tiles:
-                if self.manhattan_distance(self._start, tile) > top_distance:
-                    top_distance = self.manhattan_distance(self._start, tile)
-                    self._end = tile
+        ys, xs = np.divmod(indices, self._width)
 
-            self._end.set_state(10)
+        return np.unique(np.concatenate((
+            indices[ys > 0] - self._width,                 # Top
+            indices[xs < self._width - 1] + 1,             # Right
+            indices[ys < self._height - 1] + self._width,  # Bottom
+            indices[xs > 0] - 1                            # Left
+        )))
 
-    def _generate_path(self) -> None:
-        """Generates a random path for the base array."""
+    def _generate_path(self, vectorized=True, deduplicate=True,
+                       farthest_end=False) -> None:
+        """Generates a random path for the base array.
+
+        Parameters:
+        -----------
+         - vectorized: bool (default=True)
+            Determines whether the square neighbor counts of each wave of
+            candidates are computed at once with NumPy array operations or
+            node by node.
+         - deduplicate: bool (default=True)
+            Determines whether candidates shared by several frontier nodes are
+            only considered once. Only used by the vectorized mode. If
+            disabled, the same random calls as in the node-by-node mode are
+            performed, so both modes generate the same maze for the same seed.
+         - farthest_end: bool (default=False)
+            Determines whether the end is placed by path distance (see
+            `_set_end_node`).
+        """
 
         if self._is_generated:
             self._reset_generated_nodes()
 
+        if vectorized:
+            self._generate_path_vectorized(deduplicate)
+        else:
+            self._generate_path_iterative()
+
+        self._set_end_node(farthest=farthest_end)
+        self._adjacency = self._grid.adjacency()
+        self._is_generated = True
+        self._invalidate_distances()
+
+    def _generate_path_vectorized(self, deduplicate: bool) -> None:
+        """Generates a random path by processing each wave at once."""
+
+        states, width = self._grid.states, self._width
+
+        # Padded mask of path cells, so that the square neighbors of any cell
+        #   can be read without bounds checking:
+        passable = np.zeros((self._height + 2, width + 2), dtype=np.int8)
+        passable[1:-1, 1:-1] = np.isin(states, (-10, 1)).reshape(
+            self._height, width)
+
+        frontier = np.array([self._start.index], dtype=np.intp)
+
+        while frontier.size:
+            if deduplicate:
+                candidates = self._get_wave_neighbors(frontier)
+            else:
+                candidates = np.array([
+                    neighbor.index for index in frontier.tolist()
+                    for neighbor in self._get_neighbors(
+                        self._grid.node_at(index))
+                ], dtype=np.intp)
+
+            # Shifted sums of the padded mask give every square neighbor count:
+            ys, xs = np.divmod(candidates, width)
+            counts = sum(
+                passable[ys + 1 + dy, xs + 1 + dx]
+                for dx, dy in self.SQUARE_OFFSETS
+            )
+            candidates = candidates[
+                (passable[ys + 1, xs + 1] == 0) & (counts <= 2)
+            ]
+
+            frontier = np.array(
+                self._randomize_divergence(candidates.tolist()), dtype=np.intp
+            )
+
+            ys, xs = np.divmod(frontier, width)
+            passable[ys + 1, xs + 1] = 1
+            states[frontier] = 1
+            self._count["path"] += len(np.unique(frontier))
+
+        self._grid.colors[states == 1] = Node.STATE_COLOR[1]
+
+    def _generate_path_iterative(self) -> None:
+        """Generates a random path by processing each node separately."""
+
         frontier = [self._start]
 
         while frontier:
@@ -545,7 +1615,7 @@ class Maze(MazeBase, Search):
             selected_nodes = self._randomize_divergence([
                 candidate for candidate in candidates if len([
                     node for node in self._get_square_neighbors(candidate)
-                    if self._node_matrix[node.y][node.x].state in (-10, 1)
+                    if node.state in (-10, 1)
                 ]) <= 2
             ])
 
@@ -554,8 +1624,24 @@ class Maze(MazeBase, Search):
                 node.set_state(1)
                 self._count["path"] += 1
 
-        self._set_end_node()
-        self._is_generated = True
+    def iter_ascii(self):
+        """Yields the ASCII representation of the maze array row by row.
+
+        Each node is represented by a character, given its state. Rows are
+        yielded without line breaks, the first and last ones being the maze's
+        frame, so only one row is held in memory at a time.
+        """
+
+        yield f"╔═{2 * '═' * self._width}╗"
+
+        states, width = self._grid.states, self._width
+        for start in range(0, self._grid.size, width):
+            yield '║ ' + ''.join(map(
+                Node.STATE_ASCII.__getitem__,
+                states[start:start + width].tolist()
+            )) + '║'
+
+        yield f"╚═{2 * '═' * self._width}╝"
 
     def ascii(self) -> str:
         """Returns an ASCII representation of the maze array.
@@ -563,13 +1649,92 @@ class Maze(MazeBase, Search):
         Each node is represented by a character, given its state.
         """
 
-        return (f"╔═{2 * '═' * self._width}╗\n" + ''.join(
-            ''.join(
-                ['║ ' + ''.join([node.ascii for node in row]) + '║\n']
-            ) for row in self._node_matrix
-        ) + f"╚═{2 * '═' * self._width}╝")
+        return '\n'.join(self.iter_ascii())
+
+    def write_ascii(self, stream=None) -> None:
+        """Writes the ASCII representation of the maze array to a stream.
+
+        Rows are written one at a time, so the whole representation is never
+        built in memory.
 
-    def image(self, show_image=True, save_image=False) -> str:
+        Parameters:
+        -----------
+         - stream : text stream (default=sys.stdout)
+            The file-like object the representation is written to.
+        """
+
+        stream = stdout if stream is None else stream
+        stream.writelines(f"{row}\n" for row in self.iter_ascii())
+        stream.flush()
+
+    def render(self, cell_size=50) -> np.ndarray:
+        """Returns the RGB pixel array of the maze image.
+
+        Each node is drawn as a square of its color surrounded by a black
+        border. The start, end and optimal path nodes are also surrounded by a
+        brighter version of their color. The whole array is built at once by
+        broadcasting the node colors over each cell's pixel block.
+
+        Parameters:
+        -----------
+         - cell_size : int (default=50)
+            The side of each node's square, in pixels.
+        """
+
+        if not isinstance(cell_size, int) or cell_size < 1:
+            raise ValueError("'cell_size' must be a positive integer.")
+
+        return self._render_cells(
+            self._grid.states.reshape(self._height, self._width),
+            self._grid.colors.reshape(self._height, self._width, 3),
+            cell_size
+        )
+
+    @staticmethod
+    def _render_cells(states, colors, cell_size: int) -> np.ndarray:
+        """Returns the RGB pixel array of a block of cells (see `render`).
+
+        Parameters:
+        -----------
+         - states : np.ndarray
+            State of each cell, with shape (rows, columns).
+         - colors : np.ndarray
+            Color of each cell, with shape (rows, columns, 3).
+         - cell_size : int
+            The side of each node's square, in pixels.
+        """
+
+        height, width = states.shape
+        border = round(cell_size * .16)
+
+        # Highlighted nodes get a brighter surrounding (black for the rest):
+        factor = np.select(
+            (states == 3, (states == -10) | (states == 10)), (1.5, 3), 0
+        )
+        highlight = np.minimum(
+            colors * factor[..., None], 255
+        ).astype(np.uint8)
+
+        outer = slice(border // 2, cell_size - border // 2 + 1)
+        inner = slice(border, cell_size - border + 1)
+
+        # Each row of cells only has two kinds of pixel lines (crossing the
+        #   surrounding square only, or both squares), which are built once:
+        lines = np.zeros((2, height, width, cell_size, 3), dtype=np.uint8)
+        lines[:, :, :, outer] = highlight[None, :, :, None]
+        lines[1, :, :, inner] = colors[:, :, None]
+        lines = lines.reshape(2, height, 1, width * cell_size, 3)
+
+        # Pixel lines are then broadcast over the rows of each cell:
+        image = np.zeros(
+            (height, cell_size, width * cell_size, 3), dtype=np.uint8
+        )
+        image[:, outer] = lines[0]
+        image[:, inner] = lines[1]
+
+        return image.reshape(height * cell_size, width * cell_size, 3)
+
+    def image(self, show_image=True, save_image=False, cell_size=50) -> str:
         """Generates an image from the maze array with colored nodes.
 
         Parameters:
@@ -578,51 +1743,11 @@ class Maze(MazeBase, Search):
             Determines whether or not the image should be displayed.
          - save_image : bool
             Determines whether or not the image should be saved.
+         - cell_size : int (default=50)
+            The side of each node's square, in pixels.
         """
 
-        # Dimensions and canvas definition:
-        cell, border = 50, 8
-
-        image = Image.new(
-            mode="RGB", size=(
-                self._width * cell, self._height * cell
-            ), color="black"
-        )
-
-        # Canvas modification:
-        image_draw = ImageDraw.Draw(image)
-
-        for row_i, row in enumerate(self._node_matrix):
-            for col_i, node in enumerate(row):
-                if node.state in (-10, 3, 10):
-                    if node.state == 3:
-                        pre_border = border
-                        pattern_fill = (
-                            int(node.color[0] + .5 * node.color[0]),
-                            int(node.color[1] + .5 * node.color[1]),
-                            int(node.color[2] + .5 * node.color[2])
-                        )
-                    else:
-                        pre_border = border
-                        pattern_fill = (
-                            int(node.color[0] + 2 * node.color[0]),
-                            int(node.color[1] + 2 * node.color[1]),
-                            int(node.color[2] + 2 * node.color[2])
-                        )
-
-                    image_draw.rectangle(((
-                        col_i * cell + pre_border // 2,
-                        row_i * cell + pre_border // 2
-                    ), (
-                        (col_i + 1) * cell - pre_border // 2,
-                        (row_i + 1) * cell - pre_border // 2
-                    )), fill=pattern_fill)
-
-                image_draw.rectangle((
-                    (col_i * cell + border, row_i * cell + border),
-                    ((col_i + 1) * cell - border,
-                     (row_i + 1) * cell - border)
-                ), fill=node.color)
+        image = Image.fromarray(self.render(cell_size), mode="RGB")
 
         # Image export:
         if show_image:
@@ -644,5 +1769,366 @@ class Maze(MazeBase, Search):
 
         return ''  # If no image is saved, no file path is returned.
 
+    def iter_frames(self, cell_size=10, step=1):
+        """Yields the frames of the exploration of the last search.
+
+        The first frame shows the maze before the search, each following one
+        reveals the next `step` explored nodes in exploration order, and the
+        last one shows the optimal path (if any). A single canvas is reused:
+        only the cells that change between frames are drawn on it, so each
+        frame costs as much as the amount of changed cells.
+
+        Yields a tuple with the canvas (RGB pixel array, which is modified in
+        place by the following frames) and the changed region, as a
+        `(left, top, right, bottom)` pixel box.
+
+        Parameters:
+        -----------
+         - cell_size : int (default=10)
+            The side of each node's square, in pixels.
+         - step : int (default=1)
+            The amount of explored nodes revealed by each frame.
+        """
+
+        if not isinstance(step, int) or step < 1:
+            raise ValueError("'step' must be a positive integer.")
+
+        if not self._is_explored:
+            raise ValueError("the maze has not been explored yet.")
+
+        final_states = self._grid.states
+        final_colors = self._grid.colors
+        order = np.array(self._explored, dtype=np.intp)
+
+        # The search is undone on a copy of the cell states and colors:
+        states, colors = final_states.copy(), final_colors.copy()
+        searched = (states == 2) | (states == 3)
+        states[searched], colors[searched] = 1, NodeBase.STATE_COLOR[1]
+
+        canvas = self._render_cells(
+            states.reshape(self._height, self._width),
+            colors.reshape(self._height, self._width, 3),
+            cell_size
+        )
+        yield canvas, (0, 0, canvas.shape[1], canvas.shape[0])
+
+        # Optimal path nodes are shown as explored until the last frame:
+        steps = [
+            (cells, np.where(final_states[cells] == 3, 2, final_states[cells]))
+            for cells in (
+                order[start:start + step]
+                for start in range(0, len(order), step)
+            )
+        ]
+        if self.optimal_path:
+            cells = np.fromiter(
+                (node.index for node in self.optimal_path), dtype=np.intp
+            )
+            steps.append((cells, final_states[cells]))
+
+        # Cells are drawn side by side and then moved to their position:
+        blocks = canvas.reshape(
+            self._height, cell_size, self._width, cell_size, 3
+        )
+
+        for cells, cell_states in steps:
+            states[cells], colors[cells] = cell_states, final_colors[cells]
+            ys, xs = np.divmod(cells, self._width)
+            blocks[ys, :, xs] = self._render_cells(
+                states[cells][None], colors[cells][None], cell_size
+            ).reshape(cell_size, len(cells), cell_size, 3).swapaxes(0, 1)
+
+            yield canvas, (
+                int(xs.min()) * cell_size, int(ys.min()) * cell_size,
+                (int(xs.max()) + 1) * cell_size,
+                (int(ys.max()) + 1) * cell_size
+            )
+
+    def animation(self, file_path=None, cell_size=10, step=1,
+                  duration=40) -> str:
+        """Exports the exploration of the last search as an animation.
+
+        Frames are written to disk as soon as they are drawn, so they are
+        never held in memory at once. GIF frames only contain the region
+        that changed since the previous one.
+
+        Parameters:
+        -----------
+         - file_path : str (default=None)
+            The path of the animated GIF file. If it does not end with
+            '.gif', it is considered a directory where each frame is saved as
+            a separate PNG image. If not given, a GIF file is saved in the
+            image directory.
+         - cell_size : int (default=10)
+            The side of each node's square, in pixels.
+         - step : int (default=1)
+            The amount of explored nodes revealed by each frame.
+         - duration : int (default=40)
+            The display time of each GIF frame, in milliseconds.
+
+        Returns the path of the saved animation.
+        """
+
+        if file_path is None:
+            if not path.isdir(f"./{self.IMAGE_DIRECTORY}"):
+                mkdir(f"./{self.IMAGE_DIRECTORY}")
+
+            file_path = f"./{self.IMAGE_DIRECTORY}/{self.IMAGE_PREFIX}" \
+                + f"_{''.join(str(time()).split('.'))}.gif"
+
+        frames = self.iter_frames(cell_size, step)
+
+        if not file_path.lower().endswith(".gif"):
+            if not path.isdir(file_path):
+                mkdir(file_path)
+
+            for number, (canvas, _) in enumerate(frames):
+                Image.fromarray(canvas).save(
+                    path.join(file_path, f"frame_{number:06}.png")
+                )
+
+            return file_path
+
+        # Every frame is mapped to a palette with the colors of both the
+        #   first and the last frames, which contain every drawn color:
+        canvas, _ = next(frames)
+        pixels = np.concatenate((canvas, self.render(cell_size)))
+        colors = np.unique(pixels.reshape(-1, 3) @ np.array(
+            (1 << 16, 1 << 8, 1), dtype=np.uint32
+        ))
+
+        if len(colors) <= 256:
+            palette = Image.new("P", (1, 1))
+            palette.putpalette(np.stack(
+                (colors >> 16, colors >> 8 & 255, colors & 255), axis=1
+            ).astype(np.uint8).tobytes())
+
+        else:
+            palette, colors = Image.fromarray(pixels).quantize(256), None
+
+        first = self._quantize(canvas, palette, colors)
+        header, _ = GifImagePlugin.getheader(
+            first, info={"loop": 0, "optimize": False}
+        )
+
+        with open(file_path, "wb") as file:
+            file.writelines(header)
+            file.writelines(GifImagePlugin.getdata(first, duration=duration))
+
+            for canvas, (left, top, right, bottom) in frames:
+                file.writelines(GifImagePlugin.getdata(
+                    self._quantize(
+                        canvas[top:bottom, left:right], palette, colors
+                    ),
+                    (left, top), duration=duration
+                ))
+
+            file.write(b";")  # GIF trailer.
+
+        return file_path
+
+    @staticmethod
+    def _quantize(pixels: np.ndarray, palette: Image.Image,
+                  colors=None) -> Image.Image:
+        """Returns a palette image of an RGB pixel array, without dithering.
+
+        Parameters:
+        -----------
+         - pixels : np.ndarray
+            The RGB pixel array.
+         - palette : Image.Image
+            The palette image whose colors are used.
+         - colors : np.ndarray (default=None)
+            Sorted colors of the palette, packed as `0xRRGGBB` integers. If
+            given, every pixel color must be one of them, and it is mapped to
+            its exact palette index. Otherwise, the nearest color is used.
+        """
+
+        if colors is None:
+            return Image.fromarray(np.ascontiguousarray(pixels)).quantize(
+                palette=palette, dither=Image.Dither.NONE
+            )
+
+        image = Image.fromarray(np.searchsorted(colors, pixels @ np.array(
+            (1 << 16, 1 << 8, 1), dtype=np.uint32
+        )).astype(np.uint8), mode="P")
+        image.putpalette(palette.getpalette())
+
+        return image
+
+    def to_bytes(self) -> bytes:
+        """Returns a compact binary representation of the maze.
+
+        The representation contains a header with the dimensions, the start
+        and end indices and the seed, followed by the state of every cell as
+        a signed byte. Search results are not included.
+        """
+
+        return self._pack_header() + self._get_path_states().tobytes()
+
+    def save(self, file_path: str, packed=False) -> None:
+        """Saves the maze to a binary file.
+
+        The file contains a header with the dimensions, the start and end
+        indices and the seed, followed by the state of every cell. Search
+        results are not included.
+
+        Parameters:
+        -----------
+         - file_path: str
+            The path of the file.
+         - packed: bool (default=False)
+            Determines whether each cell is stored as a single bit (wall or
+            path) instead of a signed byte. Packed files are eight times
+            smaller, but cannot be memory-mapped when loaded.
+        """
+
+        states = self._get_path_states()
+
+        with open(file_path, "wb") as file:
+            file.write(self.FILE_HEADER.pack(
+                self.FILE_MAGIC, self.FILE_VERSION,
+                self.FILE_PACKED if packed else 0
+            ) + self._pack_header())
+            file.write(np.packbits(states != 0) if packed else states)
+
+    @classmethod
+    def load(cls, file_path: str, mmap=True, shuffle_neighbors=True):
+        """Loads a maze from a binary file saved with `save`.
+
+        Parameters:
+        -----------
+         - file_path: str
+            The path of the file.
+         - mmap: bool (default=True)
+            Determines whether the cell states are memory-mapped instead of
+            read. Memory-mapped files open instantly, since cells are only
+            read from disk when accessed. Changes made by searches are kept
+            in memory and never written to the file.
+         - shuffle_neighbors: bool (default=True)
+            Determines whether the neighbors of each node are visited in a
+            random order during searches.
+        """
+
+        with open(file_path, "rb") as file:
+            magic, version, flags = cls.FILE_HEADER.unpack(
+                file.read(cls.FILE_HEADER.size)
+            )
+            width, height, start, end, seed = cls.HEADER.unpack(
+                file.read(cls.HEADER.size)
+            )
+
+        if magic != cls.FILE_MAGIC or version != cls.FILE_VERSION:
+            raise ValueError(f"'{file_path}' is not a valid maze file.")
+
+        offset, size = cls.FILE_HEADER.size + cls.HEADER.size, width * height
+
+        if flags & cls.FILE_PACKED:
+            states = np.unpackbits(
+                np.fromfile(file_path, dtype=np.uint8, offset=offset),
+                count=size
+            ).view(np.int8)
+            states[start] = -10
+            if end >= 0:
+                states[end] = 10
+
+        elif mmap:
+            states = np.memmap(
+                file_path, dtype=np.int8, mode='c', offset=offset,
+                shape=(size,)
+            )
+
+        else:
+            states = np.fromfile(
+                file_path, dtype=np.int8, count=size, offset=offset
+            )
+
+        return cls._from_states(
+            (width, height), seed, states, start, end, shuffle_neighbors
+        )
+
+    def _pack_header(self) -> bytes:
+        """Returns the serialization header of the maze."""
+
+        return self.HEADER.pack(
+            self._width, self._height, self._start.index,
+            -1 if self._end is None else self._end.index, self._seed
+        )
+
+    def _get_path_states(self) -> np.ndarray:
+        """Returns a copy of the cell states without search results."""
+
+        states = self._grid.states.copy()
+        states[(states == 2) | (states == 3)] = 1
+
+        return states
+
+    @classmethod
+    def from_bytes(cls, data: bytes, shuffle_neighbors=True):
+        """Creates a maze from its binary representation.
+
+        The path is not generated again, but read from the given data.
+
+        Parameters:
+        -----------
+         - data: bytes
+            Binary representation of the maze, as returned by `to_bytes`.
+         - shuffle_neighbors: bool (default=True)
+            Determines whether the neighbors of each node are visited in a
+            random order during searches.
+        """
+
+        width, height, start, end, seed = cls.HEADER.unpack_from(data)
+
+        return cls._from_states(
+            (width, height), seed,
+            np.frombuffer(data, dtype=np.int8, offset=cls.HEADER.size).copy(),
+            start, end, shuffle_neighbors
+        )
+
+    @classmethod
+    def _from_states(cls, dimensions, seed: int, states, start: int,
+                     end: int, shuffle_neighbors=True, adjacency=None,
+                     weights=None):
+        """Creates a maze from the given cell states, without generating it.
+
+        Parameters:
+        -----------
+         - dimensions: tuple
+            The width and height of the maze.
+         - seed: int
+            The seed of the maze's random number generator.
+         - states: np.ndarray
+            State of every cell of the maze, by flat index. The array is
+            used without being copied.
+         - start: int
+            Flat index of the start node.
+         - end: int
+            Flat index of the end node, or -1 if there is none.
+         - shuffle_neighbors: bool (default=True)
+            Determines whether the neighbors of each node are visited in a
+            random order during searches.
+         - adjacency: tuple (default=None)
+            Precomputed adjacency index of the states (see
+            `Grid.adjacency`). If not given, it is built when first needed.
+         - weights: np.ndarray (default=None)
+            Weight of every cell of the maze, by flat index. The array is
+            used without being copied, so it must not be modified.
+        """
+
+        # Path data is computed lazily, so that huge mazes load instantly:
+        maze = cls.__new__(cls)
+        MazeBase.__init__(maze, dimensions, seed, Grid(
+            *dimensions, states, weights
+        ))
+        maze.shuffle_neighbors = shuffle_neighbors
+        maze._start = maze._grid.node_at(start)
+        maze._end = None if end < 0 else maze._grid.node_at(end)
+        maze._count["path"] = None
+        maze._adjacency = adjacency
+        maze._is_generated = True
+
+        return maze
+
     def __repr__(self):
         return f"<({self._width}x{self._height}) Maze instance>"
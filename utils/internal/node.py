@@ -1,7 +1,7 @@
 """Container module for the Node class.
 
 This module contains the class structure that allows node identification and
-state management.
+state management over the cells of a Grid.
 
 Author:
 -------
@@ -13,7 +13,9 @@ class NodeBase:
     """Represents the basic attributes and methods of a Node class.
 
     Contains relational dictionaries for state, ascii and color representation
-    of the node. Also contains all node attributes' getters and setters.
+    of the node. Also contains all node attributes' getters and setters, which
+    read from and write to the grid the node belongs to (the ASCII character
+    and the default color are derived from the state, not stored).
     """
 
     STATE_STRING = {
@@ -43,82 +45,70 @@ class NodeBase:
         10: (48, 19, 92)
     }
 
-    @property
-    def x(self):
-        return self._x
-
-    @property
-    def y(self):
-        return self._y
+    __slots__ = ()
 
     @property
     def parent(self):
-        return self._parent
+        parent = self._grid.parents.item(self.index)
+        return None if parent < 0 else Node(self._grid, parent)
 
     @parent.setter
     def parent(self, value):
         if not isinstance(value, Node):
             raise TypeError("Invalid type for parent assignment.")
 
-        self._parent = value
+        self._grid.parents[self.index] = value.index
 
     @property
     def state(self):
-        return self._state
+        return self._grid.states.item(self.index)
 
     @property
     def weight(self):
-        return self._weight
+        return self._grid.weights.item(self.index)
 
     @weight.setter
     def weight(self, value: float):
         if not isinstance(value, (int, float)):
             raise TypeError("Invalid type for weight assignment.")
 
-        self._weight = value
+        self._grid.weights[self.index] = value
 
     @property
     def color(self):
-        return self._color
+        return tuple(self._grid.colors[self.index].tolist())
 
     @property
     def ascii(self):
-        return self._ascii
+        return self.STATE_ASCII[self.state]
 
 
 class Node(NodeBase):
-    """Data structure that represents a special element of an array.
+    """Lightweight view over a single cell of a Grid.
+
+    Nodes do not hold any data by themselves: their state, search weight,
+    parent node and color are read from and written to the typed arrays of
+    the grid they belong to. Hence, they can be created on demand and
+    discarded right after being used.
 
-    Each node has special properties that determine its location in the array,
-    state, search weight, parent node and color.
+    The flat index and the coordinates of the cell are stored in slots and
+    read as plain attributes, since they are accessed in every search step.
 
     Parameters
     ----------
-     - x : int
-        X axis coordinate (matrix row).
-     - y : int
-        Y axis coordinate (matrix column).
-     - state : int
-        Value that defines the node's qualities (0: wall, 1: path...).
-     - weight : int
-        Value that measures how much the overall path cost increases when the
-        node is considered as part of it.
+     - grid : Grid
+        Grid that contains the cell's data.
+     - index : int
+        Flat index of the cell in the grid (`y * width + x`).
     """
 
-    def __init__(self, x: int, y: int, state=0, weight=0):
-        # Node localization:
-        self._x, self._y = x, y
-        self._parent = None
+    __slots__ = ("_grid", "index", "x", "y")
 
-        # Node classification:
-        self._state = state
-        self._weight = weight
+    def __init__(self, grid, index: int):
+        self._grid, self.index = grid, index
+        self.y, self.x = divmod(index, grid.width)
 
-        # Display:
-        self._color = self.STATE_COLOR[self.state]
-        self._ascii = self.STATE_ASCII[self.state]
-
-    def set_state(self, state: int, set_color=True, set_ascii=True) -> None:
+    def set_state(self, state: int, set_color=True) -> None:
         """Changes state and its linked attributes.
 
         Parameters:
@@ -127,36 +117,40 @@ class Node(NodeBase):
             New state value.
          - set_color : bool
             Determines whether the node's color should be updated or not.
-         - set_ascii : bool
-            Determines whether the node's ASCII representation should be
-            updated or not.
         """
 
-        self._state = state
+        self._grid.states[self.index] = state
 
-        if set_color:
-            self._color = self.STATE_COLOR[self.state]
-        if set_ascii:
-            self._ascii = self.STATE_ASCII[self.state]
+        # Colors not allocated yet are derived from the states when needed:
+        if set_color and self._grid.has_colors:
+            self._grid.colors[self.index] = self.STATE_COLOR[state]
 
     def set_color(self, rgb: tuple) -> None:
         """Changes node color."""
 
-        self._color = rgb
+        self._grid.colors[self.index] = rgb
 
     def set_parent(self, parent):
         """Changes parent node reference."""
 
-        self._parent = parent
+        self._grid.parents[self.index] = -1 if parent is None \
+            else parent.index
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self._grid is other._grid \
+            and self.index == other.index
+
+    def __hash__(self):
+        return hash(self.index)
 
     def __str__(self):
-        return f"<Node object with state {self._state}>"
+        return f"<Node object with state {self.state}>"
 
     def __repr__(self):
         return f"""Node(
-    X: {self._x},
-    Y: {self._y},
-    State: {self.STATE_STRING[self._state]},
-    Weight: {self._weight},
-    Parent: {self._parent}
+    X: {self.x},
+    Y: {self.y},
+    State: {self.STATE_STRING[self.state]},
+    Weight: {self.weight},
+    Parent: {self.parent}
 )"""
@@ -0,0 +1,110 @@
+"""Container module for the SearchStats class.
+
+This module contains the class structure that collects the metrics of a
+single search run (node counters, frontier size and time spent in each stage),
+so that the cost of each part of a search can be compared between algorithms
+and maze sizes.
+
+Author:
+-------
+ - Paulo Sanchez (@erlete)
+"""
+
+
+from time import perf_counter
+
+
+class SearchStats:
+    """Metrics of a single search run.
+
+    Times are measured in seconds with `time.perf_counter`. The total time
+    goes from the start to the end of the search, so for step-wise searches
+    it also includes the time spent by the caller between steps.
+
+    Parameters:
+    -----------
+     - size : int (default=0)
+        The amount of cells of the searched maze.
+     - timed : bool (default=True)
+        Determines whether the time spent looking up neighbors and using the
+        frontier is measured. If disabled, `clock` always returns zero, so
+        both times stay at zero and each operation skips the timer call.
+
+    Attributes:
+    -----------
+     - expanded : int
+        The amount of nodes removed from the frontier and expanded.
+     - enqueued : int
+        The amount of nodes added to the frontier, repetitions included.
+     - duplicate_enqueues : int
+        The amount of additions of nodes that had already been enqueued.
+     - peak_frontier : int
+        The largest amount of nodes in the frontier after an expansion.
+     - neighbor_time : float
+        Time spent looking up the neighbors of the expanded nodes.
+     - frontier_time : float
+        Time spent adding nodes to and removing nodes from the frontier.
+     - finish_time : float
+        Time spent coloring the explored nodes and determining the optimal
+        path.
+     - total_time : float
+        Wall time of the whole search.
+    """
+
+    FIELDS = (
+        "expanded", "enqueued", "duplicate_enqueues", "peak_frontier",
+        "neighbor_time", "frontier_time", "finish_time", "total_time"
+    )
+
+    def __init__(self, size=0, timed=True):
+        self.expanded = self.enqueued = self.duplicate_enqueues = 0
+        self.peak_frontier = 0
+        self.neighbor_time = self.frontier_time = 0.
+        self.finish_time = self.total_time = 0.
+        # Disabled clocks always return zero (`float()`):
+        self.clock = perf_counter if timed else float
+        self._discovered = bytearray(size)  # Enqueued flag of each cell.
+
+    def enqueue(self, nodes) -> None:
+        """Records the addition of several nodes to the frontier.
+
+        Parameters:
+        -----------
+         - nodes : list, tuple
+            The added nodes.
+        """
+
+        self.enqueued += len(nodes)
+        discovered = self._discovered
+
+        for node in nodes:
+            if discovered[node.index]:
+                self.duplicate_enqueues += 1
+            else:
+                discovered[node.index] = 1
+
+    def expand(self, frontier_size: int) -> None:
+        """Records the expansion of a node.
+
+        Parameters:
+        -----------
+         - frontier_size : int
+            The amount of nodes in the frontier after the expansion.
+        """
+
+        self.expanded += 1
+
+        if frontier_size > self.peak_frontier:
+            self.peak_frontier = frontier_size
+
+    def as_dict(self) -> dict:
+        """Returns every metric in a dictionary."""
+
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{field}={value!r}" for field, value in self.as_dict().items()
+        )
+
+        return f"SearchStats({values})"